@@ -368,8 +368,35 @@ class AnnotationTextualMixin:
 class TokenOccurrenceMixin:
     """Mixin for finding token occurrences in text."""
 
+    def _surface_ranks(self, tokens: list[Token]) -> dict[int, int]:
+        """
+        Rank each token among the tokens sharing its surface text.
+
+        Computing this once per sentence lets :meth:`_find_token_occurrence`
+        look up a token's rank instead of rescanning every token before it.
+
+        Args:
+            tokens: List of all tokens in the sentence
+
+        Returns:
+            Mapping of ``id(token)`` to the number of tokens with the same
+            surface text that come before it in order_index order
+
+        """
+        counts: dict[str, int] = {}
+        ranks: dict[int, int] = {}
+        for token in sorted(tokens, key=lambda t: t.order_index):
+            rank = counts.get(token.surface, 0)
+            ranks[id(token)] = rank
+            counts[token.surface] = rank + 1
+        return ranks
+
     def _find_token_occurrence(
-        self, text: str, token: Token, tokens: list[Token]
+        self,
+        text: str,
+        token: Token,
+        tokens: list[Token],
+        surface_ranks: dict[int, int] | None = None,
     ) -> int | None:
         """
         Find the occurrence position of a token's surface text in the sentence.
@@ -382,15 +409,34 @@ class TokenOccurrenceMixin:
             token: The token to find
             tokens: List of all tokens in the sentence
 
+        Keyword Args:
+            surface_ranks: Precomputed ranks from :meth:`_surface_ranks` for
+                ``tokens``, for callers locating every token in a sentence
+
         Returns:
             Character position of the token occurrence, or None if not found
 
         """
         surface = token.surface
-        # Find all occurrences of this surface text
+        # Use order_index to determine which occurrence this token represents:
+        # count how many tokens with the same surface appear before this one
+        same_surface_count = (
+            surface_ranks.get(id(token)) if surface_ranks is not None else None
+        )
+        if same_surface_count is None:
+            # Sort tokens by order_index to ensure correct counting
+            sorted_tokens = sorted(tokens, key=lambda t: t.order_index)
+            same_surface_count = 0
+            for t in sorted_tokens:
+                if t.order_index >= token.order_index:
+                    break
+                if t.surface == surface:
+                    same_surface_count += 1
+
+        # Find occurrences of this surface text, up to the one we want
         occurrences = []
         start = 0
-        while True:
+        while len(occurrences) <= same_surface_count:
             pos = text.find(surface, start)
             if pos == -1:
                 break
@@ -400,17 +446,6 @@ class TokenOccurrenceMixin:
         if not occurrences:
             return None
 
-        # Use order_index to determine which occurrence this token represents
-        # Count how many tokens with the same surface appear before this one
-        # Sort tokens by order_index to ensure correct counting
-        sorted_tokens = sorted(tokens, key=lambda t: t.order_index)
-        same_surface_count = 0
-        for t in sorted_tokens:
-            if t.order_index >= token.order_index:
-                break
-            if t.surface == surface:
-                same_surface_count += 1
-
         # Select the occurrence at the same_surface_count index
         if same_surface_count < len(occurrences):
             return occurrences[same_surface_count]
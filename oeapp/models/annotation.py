@@ -1,7 +1,8 @@
 """Annotation model."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from sqlalchemy import (
     Boolean,
@@ -21,6 +22,36 @@ from oeapp.utils import from_utc_iso, to_utc_iso
 if TYPE_CHECKING:
     from oeapp.models.token import Token
 
+#: The user-editable annotation fields, in the order used by
+#: :meth:`Annotation.state_snapshot`
+_STATE_FIELDS: tuple[str, ...] = (
+    "pos",
+    "gender",
+    "number",
+    "case",
+    "declension",
+    "pronoun_type",
+    "pronoun_number",
+    "verb_class",
+    "verb_tense",
+    "verb_person",
+    "verb_mood",
+    "verb_aspect",
+    "verb_form",
+    "prep_case",
+    "adverb_degree",
+    "adjective_inflection",
+    "adjective_degree",
+    "conjunction_type",
+    "uncertain",
+    "alternatives_json",
+    "confidence",
+    "modern_english_meaning",
+    "root",
+)
+#: Getter returning the values of :data:`_STATE_FIELDS` as a tuple
+_state_getter = attrgetter(*_STATE_FIELDS)
+
 
 class Annotation(AnnotationTextualMixin, Base):
     """Represents grammatical/morphological annotations for a token."""
@@ -161,6 +192,9 @@ class Annotation(AnnotationTextualMixin, Base):
     # Relationships
     token: Mapped[Token] = relationship("Token", back_populates="annotation")
 
+    #: The user-editable fields captured by :meth:`state_snapshot`
+    STATE_FIELDS: ClassVar[tuple[str, ...]] = _STATE_FIELDS
+
     @classmethod
     def exists(cls, session: Session, token_id: int) -> bool:
         """
@@ -175,6 +209,19 @@ class Annotation(AnnotationTextualMixin, Base):
         """
         return session.get(cls, annotation_id)
 
+    def state_snapshot(self) -> dict[str, Any]:
+        """
+        Capture the user-editable fields of this annotation.
+
+        This is the state recorded by
+        :class:`~oeapp.services.commands.AnnotateTokenCommand` for undo/redo.
+
+        Returns:
+            Dictionary mapping each field in :attr:`STATE_FIELDS` to its value
+
+        """
+        return dict(zip(_STATE_FIELDS, _state_getter(self), strict=True))
+
     def to_json(self) -> dict:
         """
         Serialize annotation to JSON-compatible dictionary.
@@ -26,8 +26,12 @@ class AutosaveService(QObject):
         self.save_callback = save_callback
         #: The debounce delay in milliseconds.
         self.debounce_ms = debounce_ms
-        #: The timer for the debounce.
-        self._timer: QTimer | None = None
+        #: The timer for the debounce.  It is reused for every trigger, since
+        #: restarting a running timer just pushes back its deadline.
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._save)
         #: Whether there is a pending autosave.
         self._pending = False
 
@@ -36,14 +40,7 @@ class AutosaveService(QObject):
         Trigger autosave (will be debounced).
         """
         self._pending = True
-        # Cancel existing timer if any
-        if self._timer:
-            self._timer.stop()
-            self._timer.deleteLater()
-        # Create and start new timer
-        self._timer = QTimer(self)
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._save)
+        # Restart the timer, which also cancels the countdown if one is running
         self._timer.start(self.debounce_ms)
 
     def _save(self) -> None:
@@ -70,10 +67,7 @@ class AutosaveService(QObject):
         cancelled and the save callback is called immediately.
 
         """
-        if self._timer:
-            self._timer.stop()
-            self._timer.deleteLater()
-            self._timer = None
+        self._timer.stop()
         self._pending = False
         try:
             self.save_callback()
@@ -85,8 +79,5 @@ class AutosaveService(QObject):
         Cancel pending autosave, meaning the autosave timer is cancelled and the
         save callback is not called.
         """
-        if self._timer:
-            self._timer.stop()
-            self._timer.deleteLater()
-            self._timer = None
+        self._timer.stop()
         self._pending = False
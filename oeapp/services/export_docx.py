@@ -191,10 +191,13 @@ class DOCXExporter(AnnotationTextualMixin, TokenOccurrenceMixin):
         token_positions: list[tuple[int, int, Token]] = []
         used_positions: set[tuple[int, int]] = set()
 
+        surface_ranks = self._surface_ranks(tokens)
         for token in sorted_tokens:
             if not token.surface:
                 continue
-            token_start = self._find_token_occurrence(text, token, tokens)
+            token_start = self._find_token_occurrence(
+                text, token, tokens, surface_ranks=surface_ranks
+            )
             if token_start is not None:
                 token_end = token_start + len(token.surface)
                 position_key = (token_start, token_end)
@@ -69,6 +69,22 @@ class AnnotationModal(AnnotationLookupsMixin, QDialog):
 
         """
         super().__init__(parent)
+        self._set_token(token, annotation)
+        self.fields_widget: QWidget | None = None
+        self.preset_service = AnnotationPresetService()
+        self._setup_ui()
+        self._setup_keyboard_shortcuts()
+        self._load_existing_annotation()
+
+    def _set_token(self, token: Token, annotation: Annotation | None) -> None:
+        """
+        Set the token being annotated and its annotation.
+
+        Args:
+            token: Token to annotate
+            annotation: Existing annotation (if any)
+
+        """
         self.token = token
         # Get or create annotation
         if annotation:
@@ -76,10 +92,25 @@ class AnnotationModal(AnnotationLookupsMixin, QDialog):
         else:
             # Annotation will be created when saved if it doesn't exist
             self.annotation = Annotation(token_id=cast("int", token.id))
-        self.fields_widget: QWidget | None = None
-        self.preset_service = AnnotationPresetService()
-        self._setup_ui()
-        self._setup_keyboard_shortcuts()
+
+    def set_context(self, token: Token, annotation: Annotation | None = None) -> None:
+        """
+        Re-target the modal at another token, resetting the form.
+
+        This allows a single modal to be reused for many tokens instead of
+        building a new dialog each time.
+
+        Args:
+            token: Token to annotate
+
+        Keyword Args:
+            annotation: Existing annotation (if any)
+
+        """
+        self._set_token(token, annotation)
+        self.setWindowTitle(f"Annotate: {self.token.surface}")
+        self.header_label.setText(f"Token: <b>{self.token.surface}</b>")
+        self._clear_all()
         self._load_existing_annotation()
 
     def _setup_ui(self):  # noqa: PLR0915
@@ -94,9 +125,9 @@ class AnnotationModal(AnnotationLookupsMixin, QDialog):
         layout = QVBoxLayout(self)
 
         # Header: Current token word and POS status
-        header_label = QLabel(f"Token: <b>{self.token.surface}</b>")
-        header_label.setFont(self.font())
-        layout.addWidget(header_label)
+        self.header_label = QLabel(f"Token: <b>{self.token.surface}</b>")
+        self.header_label.setFont(self.font())
+        layout.addWidget(self.header_label)
 
         self.status_label = QLabel("POS: Not set")
         self.status_label.setStyleSheet("color: #666; font-style: italic;")
@@ -352,7 +352,9 @@ class MainWindow(QMainWindow):
         self.autosave_service = AutosaveService(self.action_service.autosave)
         self.command_manager = CommandManager(self.session)
 
-        # Clear existing content
+        # Clear existing content, keeping edits the old cards have not saved
+        for card in self.sentence_cards:
+            card.flush_pending_edits()
         for i in reversed(range(self.content_layout.count())):
             self.content_layout.itemAt(i).widget().setParent(None)  # type: ignore[union-attr]
 
@@ -370,8 +372,7 @@ class MainWindow(QMainWindow):
             card = SentenceCard(
                 sentence, session=self.session, command_manager=self.command_manager
             )
-            card.set_tokens(sentence.tokens)
-            card.translation_edit.textChanged.connect(self._on_translation_changed)
+            card.translation_committed.connect(self._on_translation_changed)
             card.oe_text_edit.textChanged.connect(self._on_sentence_text_changed)
             card.sentence_merged.connect(self._on_sentence_merged)
             card.sentence_added.connect(self._on_sentence_added)
@@ -383,7 +384,10 @@ class MainWindow(QMainWindow):
 
     def _on_translation_changed(self) -> None:
         """
-        Handle translation text change by autosaving.
+        Handle a saved translation edit by autosaving.
+
+        Cards debounce translation typing, so this runs once per burst of
+        edits rather than on every keystroke.
         """
         if self.autosave_service:
             self.show_message("Saving...", duration=500)
@@ -404,6 +408,8 @@ class MainWindow(QMainWindow):
         if not self.session or not self.current_project_id:
             self.show_warning("No project open")
             return
+        for card in self.sentence_cards:
+            card.flush_pending_edits()
         if self.autosave_service:
             self.autosave_service.save_now()
             self.show_message("Project saved")
@@ -1,20 +1,26 @@
 """Sentence card UI component."""
 
-from contextlib import suppress
-from typing import TYPE_CHECKING, ClassVar, cast
-
-from PySide6.QtCore import QPoint, QTimer, Signal
+import sys
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager, suppress
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from PySide6.QtCore import QPoint, QSignalBlocker, QTimer, Signal
 from PySide6.QtGui import (
     QColor,
     QFont,
     QKeySequence,
     QMouseEvent,
     QShortcut,
+    QShowEvent,
     Qt,
     QTextCharFormat,
     QTextCursor,
 )
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QHBoxLayout,
     QLabel,
@@ -29,6 +35,7 @@ from PySide6.QtWidgets import (
 from oeapp.mixins import TokenOccurrenceMixin
 from oeapp.models.annotation import Annotation
 from oeapp.models.sentence import Sentence
+from oeapp.models.token import Token
 from oeapp.services import (
     AddSentenceCommand,
     AnnotateTokenCommand,
@@ -49,26 +56,106 @@ from oeapp.ui.token_table import TokenTable
 from oeapp.utils import get_logo_pixmap
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from sqlalchemy.orm import Session
 
     from oeapp.models.note import Note
-    from oeapp.models.token import Token
+
+
+@cache
+def _qcolor(red: int, green: int, blue: int, alpha: int = 255) -> QColor:
+    """
+    Get a shared :class:`QColor` for the given RGBA components.
+
+    Identical colors used across the highlight color tables resolve to the
+    same instance, so they are only constructed once.
+
+    Args:
+        red: Red component (0-255)
+        green: Green component (0-255)
+        blue: Blue component (0-255)
+
+    Keyword Args:
+        alpha: Alpha component (0-255)
+
+    Returns:
+        The shared color
+
+    """
+    return QColor(red, green, blue, alpha)
+
+
+#: Background color of the temporary token selection highlight
+_SELECTION_COLOR = _qcolor(200, 200, 0, 150)
+
+#: Shared highlight formats, keyed by the RGBA value of their background
+_background_formats: dict[int, QTextCharFormat] = {}
+
+
+def _background_format(color: QColor) -> QTextCharFormat:
+    """
+    Get a shared :class:`QTextCharFormat` with the given background color.
+
+    Extra selections copy their format, so a single format per color can be
+    shared by every selection instead of building one per highlighted token.
+
+    Args:
+        color: Background color
+
+    Returns:
+        Character format with ``color`` as its background
+
+    """
+    rgba = color.rgba()
+    char_format = _background_formats.get(rgba)
+    if char_format is None:
+        char_format = QTextCharFormat()
+        char_format.setBackground(color)
+        _background_formats[rgba] = char_format
+    return char_format
 
 
 class ClickableTextEdit(QTextEdit):
-    """QTextEdit that emits a signal when clicked."""
+    """
+    QTextEdit that emits a signal when clicked.
 
-    clicked = Signal(QPoint, object)  # position, modifiers
+    :attr:`clicked` is only emitted for left-button clicks, once the button is
+    released without the mouse having moved further than the platform drag
+    distance, so starting a text selection does not trigger a token lookup.
+    """
+
+    clicked = Signal(QPoint, Qt.KeyboardModifier)  # position, modifiers
     double_clicked = Signal(QPoint)
 
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        #: Position and modifiers of the pending left-button press, if any
+        self._press: tuple[QPoint, Qt.KeyboardModifier] | None = None
+
     def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
-        """Handle mouse press event and emit clicked signal."""
+        """Handle mouse press event and remember left-button presses."""
         super().mousePressEvent(event)
-        self.clicked.emit(event.position().toPoint(), event.modifiers())
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._press = (event.position().toPoint(), event.modifiers())
+        else:
+            self._press = None
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Handle mouse release event and emit clicked signal if not a drag."""
+        super().mouseReleaseEvent(event)
+        press, self._press = self._press, None
+        if press is None or event.button() != Qt.MouseButton.LeftButton:
+            return
+        position, modifiers = press
+        moved = (event.position().toPoint() - position).manhattanLength()
+        if moved < QApplication.startDragDistance():
+            self.clicked.emit(position, modifiers)
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """Handle mouse double-click event and emit double_clicked signal."""
         super().mouseDoubleClickEvent(event)
+        self._press = None
         self.double_clicked.emit(event.position().toPoint())
 
 
@@ -93,43 +180,83 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
     # Signal emitted when a sentence is deleted
     sentence_deleted = Signal(int)  # Emits deleted sentence ID
     # Signal emitted when a token is selected for details sidebar
-    # Note: Using object for SentenceCard to avoid circular import
+    # Note: Using QWidget for SentenceCard since the class is not yet defined
     token_selected_for_details = Signal(
-        object, object, object
+        Token, Sentence, QWidget
     )  # Token, Sentence, SentenceCard
     # Signal emitted when an annotation is applied
     annotation_applied = Signal(Annotation)
+    # Signal emitted once a (debounced) translation edit has been saved
+    translation_committed = Signal()
 
     # Color maps for highlighting
     POS_COLORS: ClassVar[dict[str | None, QColor]] = {
-        "N": QColor(173, 216, 230),  # Light blue for Noun
-        "V": QColor(255, 182, 193),  # Light pink for Verb
-        "A": QColor(144, 238, 144),  # Light green for Adjective
-        "R": QColor(255, 165, 0),  # Orange for Pronoun
-        "D": QColor(221, 160, 221),  # Plum for Determiner/Article
-        "B": QColor(175, 238, 238),  # Pale turquoise for Adverb
-        "C": QColor(255, 20, 147),  # Deep pink for Conjunction
-        "E": QColor(255, 255, 0),  # Yellow for Preposition
-        "I": QColor(255, 192, 203),  # Pink for Interjection
-        None: QColor(255, 255, 255),  # White (no highlight) for unannotated
+        "N": _qcolor(173, 216, 230),  # Light blue for Noun
+        "V": _qcolor(255, 182, 193),  # Light pink for Verb
+        "A": _qcolor(144, 238, 144),  # Light green for Adjective
+        "R": _qcolor(255, 165, 0),  # Orange for Pronoun
+        "D": _qcolor(221, 160, 221),  # Plum for Determiner/Article
+        "B": _qcolor(175, 238, 238),  # Pale turquoise for Adverb
+        "C": _qcolor(255, 20, 147),  # Deep pink for Conjunction
+        "E": _qcolor(255, 255, 0),  # Yellow for Preposition
+        "I": _qcolor(255, 192, 203),  # Pink for Interjection
+        None: _qcolor(255, 255, 255),  # White (no highlight) for unannotated
     }
 
     CASE_COLORS: ClassVar[dict[str | None, QColor]] = {
-        "n": QColor(173, 216, 230),  # Light blue for Nominative
-        "a": QColor(144, 238, 144),  # Light green for Accusative
-        "g": QColor(255, 255, 153),  # Light yellow for Genitive
-        "d": QColor(255, 200, 150),  # Light orange for Dative
-        "i": QColor(255, 182, 193),  # Light pink for Instrumental
-        None: QColor(255, 255, 255),  # White (no highlight) for unannotated
+        "n": _qcolor(173, 216, 230),  # Light blue for Nominative
+        "a": _qcolor(144, 238, 144),  # Light green for Accusative
+        "g": _qcolor(255, 255, 153),  # Light yellow for Genitive
+        "d": _qcolor(255, 200, 150),  # Light orange for Dative
+        "i": _qcolor(255, 182, 193),  # Light pink for Instrumental
+        None: _qcolor(255, 255, 255),  # White (no highlight) for unannotated
     }
 
     NUMBER_COLORS: ClassVar[dict[str | None, QColor]] = {
-        "s": QColor(173, 216, 230),  # Light blue for Singular
-        "p": QColor(255, 127, 127),  # Light coral for Plural
-        None: QColor(255, 255, 255),  # White (no highlight) for unannotated
+        "s": _qcolor(173, 216, 230),  # Light blue for Singular
+        "p": _qcolor(255, 127, 127),  # Light coral for Plural
+        None: _qcolor(255, 255, 255),  # White (no highlight) for unannotated
+    }
+
+    #: Delay in milliseconds used to coalesce bursts of text changes
+    TEXT_DEBOUNCE_MS: ClassVar[int] = 200
+    #: Delay in milliseconds before saved annotations are committed, so that
+    #: annotations saved in quick succession share one commit
+    ANNOTATION_COMMIT_MS: ClassVar[int] = 150
+
+    #: Keys of :attr:`POS_COLORS` that map to a non-default highlight color
+    _HIGHLIGHTABLE_POS: ClassVar[frozenset[str]] = frozenset(
+        key for key in POS_COLORS if key is not None
+    )
+    #: Keys of :attr:`CASE_COLORS` that map to a non-default highlight color
+    _HIGHLIGHTABLE_CASE: ClassVar[frozenset[str]] = frozenset(
+        key for key in CASE_COLORS if key is not None
+    )
+    #: Keys of :attr:`NUMBER_COLORS` that map to a non-default highlight color
+    _HIGHLIGHTABLE_NUMBER: ClassVar[frozenset[str]] = frozenset(
+        key for key in NUMBER_COLORS if key is not None
+    )
+    #: POS tags whose tokens are highlighted by case
+    _CASE_HIGHLIGHT_POS: ClassVar[frozenset[str]] = frozenset("DNRAE")
+    #: POS tags whose tokens are highlighted by number
+    _NUMBER_HIGHLIGHT_POS: ClassVar[frozenset[str]] = frozenset("DNRAV")
+
+    #: Index of each highlight mode in the highlighting dropdown
+    _HIGHLIGHT_MODE_INDEX: ClassVar[dict[str, int]] = {
+        "pos": 1,
+        "case": 2,
+        "number": 3,
+    }
+
+    #: Key sequences for the card's keyboard shortcuts, built once and shared
+    #: by every card
+    _KEYS: ClassVar[dict[str, QKeySequence]] = {
+        "annotate": QKeySequence(Qt.Key.Key_A),
+        "next": QKeySequence(Qt.Key.Key_Right),
+        "prev": QKeySequence(Qt.Key.Key_Left),
     }
 
-    def __init__(
+    def __init__(  # noqa: PLR0915
         self,
         sentence: Sentence,
         session: Session | None = None,
@@ -140,16 +267,39 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         self.sentence = sentence
         self.session = session
         self.command_manager = command_manager
-        self.token_table = TokenTable()
+        # Token table, hidden by default and built on first use
+        self._token_table: TokenTable | None = None
         self.tokens: list[Token] = sentence.tokens
-        self.annotations: dict[int, Annotation | None] = {
-            cast("int", token.id): token.annotation for token in self.tokens if token.id
-        }
+        # Annotations keyed by token id
+        self.annotations: dict[int, Annotation | None] = {}
+        # Annotations by token position in :attr:`tokens`
+        self._annotations: list[Annotation | None] = []
+        # Position in :attr:`tokens` of each token id
+        self._token_index: dict[int, int] = {}
+        # Pre-resolved ``(pos, case, number)`` highlight entries by token
+        # position; each entry is a ``(key, color)`` pair, or None if not
+        # highlighted
+        self._cached_colors: list[tuple[tuple[str, QColor] | None, ...]] = []
+        # The ``(token position, key, color)`` entries of the tokens that are
+        # highlighted in each slot of :attr:`_cached_colors`, built on first
+        # use after the annotations change
+        self._highlightable: dict[int, list[tuple[int, str, QColor]]] = {}
+        # Bumped whenever the tokens' annotations or highlight colors change
+        self._annotations_version: int = 0
+        self._load_annotations()
+        # Selections of the active highlighting mode, kept so temporary
+        # highlights can be layered on top without reading them back
+        self._mode_selections: list[QTextEdit.ExtraSelection] = []
+        # What :attr:`_mode_selections` were built from, so an unchanged
+        # highlighting mode is not rebuilt
+        self._mode_selections_key: tuple[Any, ...] | None = None
         # Track current highlight position to clear it later
         self._current_highlight_start: int | None = None
         self._current_highlight_length: int | None = None
         # Track current highlight mode (None, 'pos', 'case', 'number')
         self._current_highlight_mode: str | None = None
+        # Whether the highlighting went stale while the card was hidden
+        self._highlight_dirty: bool = False
         # Track selected cases for highlighting (default: all cases)
         self._selected_cases: set[str] = {"n", "a", "g", "d", "i"}
         # Track selected POS tags for highlighting (default: all POS tags)
@@ -167,11 +317,97 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         self._deselect_timer.setSingleShot(True)
         self._deselect_timer.timeout.connect(self._perform_deselection)
         self._pending_deselect_token_index: int | None = None
+        # Cached (start, end, token_index) spans of each token in the OE text,
+        # rebuilt only when the text or the tokens change
+        self._token_spans: list[tuple[int, int, int]] = []
+        self._span_starts: list[int] = []
+        self._token_ranges: dict[int, tuple[int, int]] = {}
+        self._token_spans_text: str | None = None
+        self._token_spans_dirty: bool = True
+        # ``(id, surface)`` of each token in :attr:`tokens`, to tell whether
+        # :meth:`set_tokens` was given the same tokens again
+        self._tokens_fingerprint: tuple[tuple[int | None, str], ...] = (
+            self._fingerprint_tokens(self.tokens)
+        )
+        # Plain text of :attr:`oe_text_edit`, serialized on first use after
+        # each text change so click and highlight handlers don't re-serialize
+        # the document; ``None`` means it is stale
+        self._cached_oe_text: str | None = None
+        # Timers to coalesce bursts of text changes (e.g. typing) into a
+        # single update
+        self._oe_text_debounce = QTimer(self)
+        self._oe_text_debounce.setSingleShot(True)
+        self._oe_text_debounce.setInterval(self.TEXT_DEBOUNCE_MS)
+        self._oe_text_debounce.timeout.connect(self._commit_oe_text_change)
+        self._translation_debounce = QTimer(self)
+        self._translation_debounce.setSingleShot(True)
+        self._translation_debounce.setInterval(self.TEXT_DEBOUNCE_MS)
+        self._translation_debounce.timeout.connect(self._commit_translation_change)
+        # Timer to commit saved annotations in one transaction
+        self._annotation_commit_timer = QTimer(self)
+        self._annotation_commit_timer.setSingleShot(True)
+        self._annotation_commit_timer.setInterval(self.ANNOTATION_COMMIT_MS)
+        self._annotation_commit_timer.timeout.connect(self._commit_annotations)
+        # Don't lose debounced changes if the application quits first
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_edits)
+        # Annotation modal, created on first use and reused for every token
+        self._annotation_modal: AnnotationModal | None = None
+        # ``(token_id, state)`` snapshot of the annotation being edited in the
+        # modal, taken before the modal changes it
+        self._annotation_before_state: tuple[int, dict[str, Any]] | None = None
         # Track OE edit mode state
         self._oe_edit_mode: bool = False
         self._original_oe_text: str | None = None
+        # Map of highlight mode to the method that applies it
+        self._highlight_dispatch: dict[str, Callable[[], None]] = {
+            "pos": self._apply_pos_highlighting,
+            "case": self._apply_case_highlighting,
+            "number": self._apply_number_highlighting,
+        }
+        # Keyboard shortcuts are only created once the card is first shown
+        self._shortcuts_setup: bool = False
         self._setup_ui()
-        self._setup_shortcuts()
+
+    @property
+    def token_table(self) -> TokenTable:
+        """
+        The token annotation table for this card.
+
+        The table is hidden until the user shows it, so it is only built the
+        first time it is needed rather than for every card in the project.
+
+        Returns:
+            The token table
+
+        """
+        if self._token_table is None:
+            self._token_table = TokenTable()
+            self._token_table.annotation_requested.connect(self._open_annotation_modal)
+            self._token_table.token_selected.connect(self._highlight_token_in_text)
+            self._token_table.setVisible(False)
+            self._token_table_layout.addWidget(self._token_table)
+            self._token_table.set_tokens(self.tokens)
+        return self._token_table
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        """
+        Handle show event.
+
+        Sets up the keyboard shortcuts the first time the card is shown, and
+        re-applies highlighting that went stale while it was hidden.
+
+        Args:
+            event: Show event
+
+        """
+        super().showEvent(event)
+        if not self._shortcuts_setup:
+            self._setup_shortcuts()
+            self._shortcuts_setup = True
+        if self._highlight_dirty:
+            self._reapply_current_highlight()
 
     @property
     def has_focus(self) -> bool:
@@ -181,7 +417,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         return any(
             [
                 self.hasFocus(),
-                self.token_table.has_focus,
+                self._token_table is not None and self._token_table.has_focus,
                 self.translation_edit.hasFocus(),
                 self.oe_text_edit.hasFocus(),
             ]
@@ -199,13 +435,13 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         - 'Ctrl+Delete' to delete sentence
         """
         # 'A' key to annotate selected token
-        annotate_shortcut = QShortcut(QKeySequence("A"), self)
+        annotate_shortcut = QShortcut(self._KEYS["annotate"], self)
         annotate_shortcut.activated.connect(self._open_annotation_modal)
 
         # Arrow keys for token navigation
-        next_token_shortcut = QShortcut(QKeySequence("Right"), self)
+        next_token_shortcut = QShortcut(self._KEYS["next"], self)
         next_token_shortcut.activated.connect(self._next_token)
-        prev_token_shortcut = QShortcut(QKeySequence("Left"), self)
+        prev_token_shortcut = QShortcut(self._KEYS["prev"], self)
         prev_token_shortcut.activated.connect(self._prev_token)
 
     def _next_token(self) -> None:
@@ -311,6 +547,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         self.oe_text_edit.setPlaceholderText("Enter Old English text...")
         # Make read-only by default (selectable but not editable)
         self.oe_text_edit.setReadOnly(True)
+        self.oe_text_edit.textChanged.connect(self._invalidate_oe_plain_text)
         self.oe_text_edit.textChanged.connect(self._on_oe_text_changed)
         self.oe_text_edit.clicked.connect(self._on_oe_text_clicked)
         self.oe_text_edit.double_clicked.connect(self._on_oe_text_double_clicked)
@@ -328,12 +565,10 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         # Use QTimer.singleShot to ensure widget is fully initialized
         QTimer.singleShot(0, self._render_oe_text_with_superscripts)
 
-        # Token annotation grid (hidden by default)
-        self.token_table.annotation_requested.connect(self._open_annotation_modal)
-        self.token_table.token_selected.connect(self._highlight_token_in_text)
-        self.token_table.setVisible(False)
-        layout.addWidget(self.token_table)
-        self.set_tokens(self.tokens)
+        # Token annotation grid (hidden by default, built by :attr:`token_table`)
+        self._token_table_layout = QVBoxLayout()
+        self._token_table_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(self._token_table_layout)
 
         # Modern English translation with toggle button
         translation_label_layout = QHBoxLayout()
@@ -381,18 +616,75 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
 
         """
         self.tokens = tokens
+        self._load_annotations()
+        fingerprint = self._fingerprint_tokens(tokens)
+        unchanged = fingerprint == self._tokens_fingerprint
+        self._tokens_fingerprint = fingerprint
+        if not unchanged:
+            self._token_spans_dirty = True
+        if self._token_table is not None:
+            if unchanged:
+                # Same tokens, so only their annotations can have changed
+                self._token_table.refresh_annotations(tokens)
+            else:
+                self._token_table.set_tokens(tokens)
+
+        # Re-apply highlighting if a mode is active
+        self._reapply_current_highlight()
+
+    @staticmethod
+    def _fingerprint_tokens(
+        tokens: list[Token],
+    ) -> tuple[tuple[int | None, str], ...]:
+        """
+        Identify a token list by the ids and surfaces of its tokens.
+
+        Args:
+            tokens: List of tokens
+
+        Returns:
+            ``(id, surface)`` of each token, in order
+
+        """
+        return tuple((token.id, token.surface) for token in tokens)
+
+    def _load_annotations(self) -> None:
+        """
+        Load the annotations of :attr:`tokens` and their highlight colors.
+        """
+        self._annotations = [
+            token.annotation if token.id else None for token in self.tokens
+        ]
+        self._token_index = {
+            token.id: idx for idx, token in enumerate(self.tokens) if token.id
+        }
         self.annotations = {
-            cast("int", token.id): token.annotation for token in self.tokens if token.id
+            token.id: annotation
+            for token, annotation in zip(self.tokens, self._annotations, strict=True)
+            if token.id
         }
-        self.token_table.set_tokens(tokens)
+        self._cached_colors = [
+            self._resolve_highlight_colors(annotation)
+            for annotation in self._annotations
+        ]
+        self._highlightable.clear()
+        self._annotations_version += 1
 
-        # Re-apply highlighting if a mode is active
-        if self._current_highlight_mode == "pos":
-            self._apply_pos_highlighting()
-        elif self._current_highlight_mode == "case":
-            self._apply_case_highlighting()
-        elif self._current_highlight_mode == "number":
-            self._apply_number_highlighting()
+    def _store_annotation(self, annotation: Annotation) -> None:
+        """
+        Store an applied annotation and refresh its cached highlight colors.
+
+        Args:
+            annotation: The applied annotation
+
+        """
+        self.annotations[annotation.token_id] = annotation
+        token_idx = self._token_index.get(annotation.token_id)
+        if token_idx is not None:
+            self._annotations[token_idx] = annotation
+            self._cached_colors[token_idx] = self._resolve_highlight_colors(annotation)
+            self._highlightable.clear()
+            self._annotations_version += 1
 
     def _open_annotation_modal(self) -> None:
         """
@@ -407,13 +699,34 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             else:
                 return
 
-        # Open modal - get or create annotation
+        self._show_annotation_modal(token)
+
+    def _show_annotation_modal(self, token: Token) -> None:
+        """
+        Show the annotation modal for a token.
+
+        The modal is built on first use and then re-targeted at each new token
+        with :meth:`~oeapp.ui.dialogs.AnnotationModal.set_context`.
+
+        Args:
+            token: Token to annotate
+
+        """
+        # Get or create annotation
         annotation = token.annotation
         if annotation is None and self.session and token.id:
             annotation = Annotation.get(self.session, token.id)
-        modal = AnnotationModal(token, annotation, self)
-        modal.annotation_applied.connect(self._on_annotation_applied)
-        modal.exec()
+        self._annotation_before_state = (
+            (annotation.token_id, annotation.state_snapshot()) if annotation else None
+        )
+        if self._annotation_modal is None:
+            self._annotation_modal = AnnotationModal(token, annotation, self)
+            self._annotation_modal.annotation_applied.connect(
+                self._on_annotation_applied
+            )
+        else:
+            self._annotation_modal.set_context(token, annotation)
+        self._annotation_modal.exec()
 
     def _on_annotation_applied(self, annotation: Annotation) -> None:
         """
@@ -423,66 +736,29 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             annotation: Applied annotation
 
         """
-        # Get before state
-        before_annotation = self.annotations.get(annotation.token_id)
-        before_state = {}
-        if before_annotation:
-            before_state = {
-                "pos": before_annotation.pos,
-                "gender": before_annotation.gender,
-                "number": before_annotation.number,
-                "case": before_annotation.case,
-                "declension": before_annotation.declension,
-                "pronoun_type": before_annotation.pronoun_type,
-                "pronoun_number": before_annotation.pronoun_number,
-                "verb_class": before_annotation.verb_class,
-                "verb_tense": before_annotation.verb_tense,
-                "verb_person": before_annotation.verb_person,
-                "verb_mood": before_annotation.verb_mood,
-                "verb_aspect": before_annotation.verb_aspect,
-                "verb_form": before_annotation.verb_form,
-                "prep_case": before_annotation.prep_case,
-                "uncertain": before_annotation.uncertain,
-                "adverb_degree": before_annotation.adverb_degree,
-                "adjective_inflection": before_annotation.adjective_inflection,
-                "adjective_degree": before_annotation.adjective_degree,
-                "conjunction_type": before_annotation.conjunction_type,
-                "alternatives_json": before_annotation.alternatives_json,
-                "confidence": before_annotation.confidence,
-                "modern_english_meaning": before_annotation.modern_english_meaning,
-                "root": before_annotation.root,
-            }
-
-        after_state = {
-            "pos": annotation.pos,
-            "gender": annotation.gender,
-            "number": annotation.number,
-            "case": annotation.case,
-            "declension": annotation.declension,
-            "pronoun_type": annotation.pronoun_type,
-            "pronoun_number": annotation.pronoun_number,
-            "verb_class": annotation.verb_class,
-            "verb_tense": annotation.verb_tense,
-            "verb_person": annotation.verb_person,
-            "verb_mood": annotation.verb_mood,
-            "verb_aspect": annotation.verb_aspect,
-            "verb_form": annotation.verb_form,
-            "prep_case": annotation.prep_case,
-            "adverb_degree": annotation.adverb_degree,
-            "adjective_inflection": annotation.adjective_inflection,
-            "adjective_degree": annotation.adjective_degree,
-            "conjunction_type": annotation.conjunction_type,
-            "uncertain": annotation.uncertain,
-            "alternatives_json": annotation.alternatives_json,
-            "confidence": annotation.confidence,
-            "modern_english_meaning": annotation.modern_english_meaning,
-            "root": annotation.root,
-        }
+        # Get before state, preferring the snapshot taken before the modal
+        # edited the annotation in place
+        before_state: dict[str, Any] | None = None
+        after_state: dict[str, Any] | None = None
+        if self._annotation_before_state is not None:
+            token_id, state = self._annotation_before_state
+            self._annotation_before_state = None
+            if token_id == annotation.token_id:
+                before_state = state
+                after_state = annotation.state_snapshot()
+                if before_state == after_state:
+                    # Nothing changed, so there is nothing to save or undo
+                    return
 
         # Create command for undo/redo
         if self.command_manager and self.session:
-            assert self.command_manager is not None  # noqa: S101
-            assert self.session is not None  # noqa: S101
+            if before_state is None:
+                before_annotation = self.annotations.get(annotation.token_id)
+                before_state = (
+                    before_annotation.state_snapshot() if before_annotation else {}
+                )
+            if after_state is None:
+                after_state = annotation.state_snapshot()
             command = AnnotateTokenCommand(
                 session=self.session,
                 token_id=annotation.token_id,
@@ -490,34 +766,54 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
                 after=after_state,
             )
             if self.command_manager.execute(command):
-                # Update local cache
-                self.annotations[annotation.token_id] = annotation
-                # Update token table display
-                self.token_table.update_annotation(annotation)
-                # Emit signal for annotation applied
-                self.annotation_applied.emit(annotation)
+                with self._repaint_guard():
+                    # Update local cache
+                    self._store_annotation(annotation)
+                    # Update token table display
+                    if self._token_table is not None:
+                        self._token_table.update_annotation(annotation)
+                    # Emit signal for annotation applied
+                    self.annotation_applied.emit(annotation)
                 return
 
         # Fallback: direct save if command manager not available
         if self.session:
-            self._save_annotation(annotation)
+            annotation = self._save_annotation(annotation)
 
-        # Update local cache
-        self.annotations[annotation.token_id] = annotation
+        with self._repaint_guard():
+            # Update local cache
+            self._store_annotation(annotation)
 
-        # Update token table display
-        self.token_table.update_annotation(annotation)
+            # Update token table display
+            if self._token_table is not None:
+                self._token_table.update_annotation(annotation)
 
-        # Emit signal for annotation applied
-        self.annotation_applied.emit(annotation)
+            # Emit signal for annotation applied
+            self.annotation_applied.emit(annotation)
 
-        # Re-apply highlighting if a mode is active
-        if self._current_highlight_mode == "pos":
-            self._apply_pos_highlighting()
-        elif self._current_highlight_mode == "case":
-            self._apply_case_highlighting()
-        elif self._current_highlight_mode == "number":
-            self._apply_number_highlighting()
+            # Re-apply highlighting if a mode is active
+            self._reapply_current_highlight()
+
+    @contextmanager
+    def _repaint_guard(self) -> Iterator[None]:
+        """
+        Suspend repaints of this card while several updates are made.
+
+        Updates are re-enabled on exit, which schedules a single repaint for
+        everything changed inside the block.  Nested guards are no-ops.
+
+        Yields:
+            Nothing
+
+        """
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_oe_text_clicked(
         self, position: QPoint, modifiers: Qt.KeyboardModifier
@@ -535,7 +831,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         cursor_pos = cursor.position()
 
         # Get the plain text
-        text = self.oe_text_edit.toPlainText()
+        text = self._oe_plain_text
         if not text or not self.tokens:
             return
 
@@ -606,7 +902,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         cursor_pos = cursor.position()
 
         # Get the plain text
-        text = self.oe_text_edit.toPlainText()
+        text = self._oe_plain_text
         if not text or not self.tokens:
             return
 
@@ -625,13 +921,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             self._highlight_token_in_text(token)
             self.token_selected_for_details.emit(token, self.sentence, self)
             # Open the annotation modal for this token
-            # Get or create annotation
-            annotation = token.annotation
-            if annotation is None and self.session and token.id:
-                annotation = Annotation.get(self.session, token.id)
-            modal = AnnotationModal(token, annotation, self)
-            modal.annotation_applied.connect(self._on_annotation_applied)
-            modal.exec()
+            self._show_annotation_modal(token)
 
     def _find_token_at_position(self, text: str, position: int) -> int | None:
         """
@@ -654,29 +944,91 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         if not self.tokens:
             return None
 
-        # Build a mapping of token positions in the text
-        token_positions: list[tuple[int, int, int]] = []  # (start, end, token_index)
-
-        for token_idx, token in enumerate(self.tokens):
-            surface = token.surface
-            if not surface:
-                continue
-
-            token_start = self._find_token_occurrence(text, token, self.tokens)
-            if token_start is None:
-                continue
-
-            token_end = token_start + len(surface)
-            token_positions.append((token_start, token_end, token_idx))
-
-        # Find which token contains the position
-        for start, end, token_idx in token_positions:
+        token_spans = self._get_token_spans(text)
+        # Find the last token starting at or before the position, and check
+        # whether the position falls within it
+        idx = bisect_right(self._span_starts, position) - 1
+        if idx >= 0:
+            start, end, token_idx = token_spans[idx]
             if start <= position < end:
                 return token_idx
 
         # If position is not within any token, find the nearest token
         # (useful for whitespace between tokens)
-        return self._find_nearest_token(token_positions, position)
+        return self._find_nearest_token(token_spans, position)
+
+    def _get_token_spans(self, text: str) -> list[tuple[int, int, int]]:
+        """
+        Get the ``(start, end, token_index)`` spans of the tokens in ``text``.
+
+        Every occurrence of each distinct (interned) surface is located once,
+        and occurrences are then handed out to the tokens in order, so that
+        repeated surfaces resolve to successive positions in the text.  The
+        result is cached until the text or the tokens change.
+
+        Args:
+            text: The full sentence text
+
+        Returns:
+            List of ``(start, end, token_index)`` tuples, sorted by start
+
+        """
+        if self._token_spans_dirty or text != self._token_spans_text:
+            occurrences: dict[str, deque[int]] = {}
+            token_spans: list[tuple[int, int, int]] = []
+            pos = 0
+            for token_idx, token in enumerate(self.tokens):
+                surface = token.surface
+                if not surface:
+                    continue
+                surface = sys.intern(surface)
+                hits = occurrences.get(surface)
+                if hits is None:
+                    hits = deque(self._find_all_occurrences(text, surface))
+                    occurrences[surface] = hits
+                # Skip occurrences inside text already claimed by earlier tokens
+                while hits and hits[0] < pos:
+                    hits.popleft()
+                if not hits:
+                    continue
+                token_start = hits.popleft()
+                pos = token_start + len(surface)
+                token_spans.append((token_start, pos, token_idx))
+            self._token_spans = token_spans
+            self._span_starts = [start for start, _, _ in token_spans]
+            self._token_ranges = {
+                token_idx: (start, end) for start, end, token_idx in token_spans
+            }
+            self._token_spans_text = text
+            self._token_spans_dirty = False
+        return self._token_spans
+
+    @staticmethod
+    def _find_all_occurrences(text: str, surface: str) -> list[int]:
+        """
+        Find the start positions of every occurrence of ``surface`` in ``text``.
+
+        Overlapping occurrences are included.  :meth:`str.find` is already a
+        fast C-level substring search, and for sentence-length texts it beats
+        :func:`re.finditer`, whose per-match overhead dominates.
+
+        Args:
+            text: The full sentence text
+            surface: The surface text to find
+
+        Returns:
+            List of character positions, in ascending order
+
+        """
+        occurrences = []
+        start = 0
+        while True:
+            pos = text.find(surface, start)
+            if pos == -1:
+                break
+            occurrences.append(pos)
+            start = pos + 1
+        return occurrences
 
     def _find_nearest_token(
         self, token_positions: list[tuple[int, int, int]], position: int
@@ -684,17 +1036,22 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         """
         Find the nearest token to the given position.
 
+        Only the tokens on either side of ``position`` are considered, located
+        by a binary search on :attr:`_span_starts`.
+
         Args:
-            token_positions: List of (start, end, token_index) tuples
+            token_positions: The ``(start, end, token_index)`` spans returned by
+                :meth:`_get_token_spans`, whose starts are :attr:`_span_starts`
             position: Character position in the text
 
         Returns:
             Token index of nearest token, or None if no tokens found
 
         """
+        idx = bisect_right(self._span_starts, position)
         nearest_token = None
         min_distance = float("inf")
-        for start, end, token_idx in token_positions:
+        for start, end, token_idx in token_positions[max(idx - 1, 0) : idx + 1]:
             # Check distance to start and end of token
             if position < start:
                 distance = start - position
@@ -710,8 +1067,47 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
 
         return nearest_token
 
+    @property
+    def _oe_plain_text(self) -> str:
+        """
+        The plain text of the Old English text box.
+
+        The document is only serialized on the first read after a change.
+
+        Returns:
+            The current Old English text
+
+        """
+        if self._cached_oe_text is None:
+            self._cached_oe_text = self.oe_text_edit.toPlainText()
+        return self._cached_oe_text
+
+    def _invalidate_oe_plain_text(self) -> None:
+        """
+        Mark :attr:`_oe_plain_text`, the token spans and the highlighting
+        mode's selections as stale.
+
+        The selections must be rebuilt even if the text is unchanged, since
+        their cursors collapse when the document is reset.
+
+        This stays connected to ``textChanged`` even while
+        :meth:`_on_oe_text_changed` is disconnected in edit mode.
+        """
+        self._cached_oe_text = None
+        self._token_spans_dirty = True
+        self._mode_selections_key = None
+
     def _on_oe_text_changed(self) -> None:
-        """Handle Old English text change."""
+        """
+        Handle Old English text change.
+
+        The change is applied by :meth:`_commit_oe_text_change` once the text
+        has stopped changing for :attr:`TEXT_DEBOUNCE_MS` milliseconds.
+        """
+        self._oe_text_debounce.start()
+
+    def _commit_oe_text_change(self) -> None:
+        """Apply a debounced Old English text change."""
         # Don't process changes if not in edit mode (shouldn't happen if signal
         # is disconnected)
         if not self._oe_edit_mode:
@@ -721,12 +1117,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         self._clear_highlight()
         # Re-apply highlighting mode if active (though highlights will be
         # cleared when entering edit mode)
-        if self._current_highlight_mode == "pos":
-            self._apply_pos_highlighting()
-        elif self._current_highlight_mode == "case":
-            self._apply_case_highlighting()
-        elif self._current_highlight_mode == "number":
-            self._apply_number_highlighting()
+        self._reapply_current_highlight()
 
     def _on_edit_oe_clicked(self) -> None:
         """Handle Edit OE button click - enter edit mode."""
@@ -783,7 +1174,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             self._render_oe_text_with_superscripts()
             return
 
-        new_text = self.oe_text_edit.toPlainText()
+        new_text = self._oe_plain_text
         old_text = self.sentence.text_oe
 
         if new_text != old_text:
@@ -796,18 +1187,15 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             )
             if self.command_manager.execute(command):
                 self.sentence.text_oe = new_text
-                # Refresh tokens after retokenization
-                self.session.refresh(self.sentence)
-                self.set_tokens(self.sentence.tokens)
+                # Refresh tokens after retokenization; this must not be seen
+                # as a further edit of the text
+                with QSignalBlocker(self.oe_text_edit):
+                    self.session.refresh(self.sentence)
+                    self.set_tokens(self.sentence.tokens)
                 # Update notes display
                 self._update_notes_display()
                 # Re-apply highlighting if a mode is active
-                if self._current_highlight_mode == "pos":
-                    self._apply_pos_highlighting()
-                elif self._current_highlight_mode == "case":
-                    self._apply_case_highlighting()
-                elif self._current_highlight_mode == "number":
-                    self._apply_number_highlighting()
+                self._reapply_current_highlight()
 
         # Re-render with superscripts
         self._render_oe_text_with_superscripts()
@@ -856,7 +1244,16 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         return True
 
     def _on_translation_changed(self) -> None:
-        """Handle translation text change."""
+        """
+        Handle translation text change.
+
+        The change is saved by :meth:`_commit_translation_change` once the text
+        has stopped changing for :attr:`TEXT_DEBOUNCE_MS` milliseconds.
+        """
+        self._translation_debounce.start()
+
+    def _commit_translation_change(self) -> None:
+        """Save a debounced translation text change."""
         if not self.session or not self.command_manager or not self.sentence.id:
             return
 
@@ -873,6 +1270,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             )
             if self.command_manager.execute(command):
                 self.sentence.text_modern = new_text
+                self.translation_committed.emit()
 
     def _on_highlighting_changed(self, index: int) -> None:
         """
@@ -924,35 +1322,25 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
 
         self.highlighting_combo.blockSignals(False)  # noqa: FBT003
 
-    def _on_pos_toggle(self, checked: bool) -> None:  # noqa: FBT001
-        """Handle POS highlighting toggle."""
-        if checked:
-            # Update dropdown to Part of Speech
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(1)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(1)
-        else:
-            # Update dropdown to None
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(0)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(0)
-
-    def _on_case_toggle(self, checked: bool) -> None:  # noqa: FBT001
-        """Handle case highlighting toggle."""
-        if checked:
-            # Update dropdown to Case
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(2)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(2)
-        else:
-            # Update dropdown to None
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(0)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(0)
+    def _on_highlight_toggle(self, mode: str, checked: bool) -> None:  # noqa: FBT001
+        """
+        Handle a highlighting mode toggle.
+
+        Bind ``mode`` with :func:`functools.partial` to connect this to a
+        toggle's ``toggled`` signal.
+
+        Args:
+            mode: Highlight mode being toggled (``"pos"``, ``"case"`` or
+                ``"number"``)
+            checked: Whether the mode was switched on
+
+        """
+        index = self._HIGHLIGHT_MODE_INDEX[mode] if checked else 0
+        # Update dropdown to the mode, or to None
+        self.highlighting_combo.blockSignals(True)  # noqa: FBT003
+        self.highlighting_combo.setCurrentIndex(index)
+        self.highlighting_combo.blockSignals(False)  # noqa: FBT003
+        self._on_highlighting_changed(index)
 
     def _on_cases_changed(self, selected_cases: set[str]) -> None:
         """
@@ -1002,171 +1390,252 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         self._current_highlight_mode = None
         self._clear_all_highlights()
 
-    def _on_number_toggle(self, checked: bool) -> None:  # noqa: FBT001
-        """Handle number highlighting toggle."""
-        if checked:
-            # Update dropdown to Number
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(3)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(3)
-        else:
-            # Update dropdown to None
-            self.highlighting_combo.blockSignals(True)  # noqa: FBT003
-            self.highlighting_combo.setCurrentIndex(0)
-            self.highlighting_combo.blockSignals(False)  # noqa: FBT003
-            self._on_highlighting_changed(0)
-
-    def _apply_pos_highlighting(self) -> None:
+    def _reapply_current_highlight(self) -> None:
         """
-        Apply colors based on parts of speech.
+        Re-apply the current highlighting mode, if one is active.
 
-        Only highlights POS tags that are in the :attr:`_selected_pos` set.
+        If the card is not visible, the highlighting is only marked as stale
+        and is re-applied by :meth:`showEvent`.
         """
-        self._clear_all_highlights()
-        text = self.oe_text_edit.toPlainText()
-        if not text or not self.tokens:
+        if self._current_highlight_mode is None:
             return
+        if not self.oe_text_edit.isVisible():
+            self._highlight_dirty = True
+            return
+        self._highlight_dirty = False
+        apply_highlighting = self._highlight_dispatch.get(self._current_highlight_mode)
+        if apply_highlighting is not None:
+            apply_highlighting()
 
-        extra_selections = []
-        for token in self.tokens:
-            if not token.id:
-                continue
-            annotation = self.annotations.get(cast("int", token.id))
-            if not annotation:
-                continue
+    def _resolve_highlight_colors(
+        self, annotation: Annotation | None
+    ) -> tuple[tuple[str, QColor] | None, ...]:
+        """
+        Resolve the highlight colors for a token's annotation.
 
-            pos = annotation.pos
-            # Only highlight if POS is in selected POS tags
-            if pos in self._selected_pos:
-                color = self.POS_COLORS.get(pos, self.POS_COLORS[None])
-                if color != self.POS_COLORS[None]:  # Only highlight if not default
-                    selection = self._create_token_selection(token, text, color)
-                    if selection:
-                        extra_selections.append(selection)
+        Each slot of the returned ``(pos, case, number)`` tuple is either a
+        ``(key, color)`` pair or None if the token is not highlighted in that
+        mode; these are cached in :attr:`_cached_colors` so that repainting
+        only has to read the cache.
 
-        self.oe_text_edit.setExtraSelections(extra_selections)
+        Args:
+            annotation: The token's annotation, if any
+
+        Returns:
+            The ``(pos, case, number)`` highlight entries
 
-    def _apply_case_highlighting(self) -> None:
         """
-        Apply colors based on case values.
+        if annotation is None:
+            return (None, None, None)
+        # For prepositions, use prep_case; for others, use case
+        case_value = annotation.prep_case if annotation.pos == "E" else annotation.case
+        return self._highlight_entries(annotation.pos, case_value, annotation.number)
 
-        Highlights articles, nouns, pronouns, adjectives, and prepositions.
-        Only highlights cases that are in the :attr:`_selected_cases` set.
+    @classmethod
+    @cache
+    def _highlight_entries(
+        cls, pos: str | None, case_value: str | None, number_value: str | None
+    ) -> tuple[tuple[str, QColor] | None, ...]:
         """
-        self._clear_all_highlights()
-        text = self.oe_text_edit.toPlainText()
+        Resolve the highlight entries for one combination of annotation codes.
+
+        Only a handful of code combinations occur, so the entries are built
+        once per combination and shared by every token that has it.
+
+        Args:
+            pos: Part of speech code
+            case_value: Case code (the preposition case for prepositions)
+            number_value: Number code
+
+        Returns:
+            The ``(pos, case, number)`` highlight entries
+
+        """
+        pos_entry = (
+            (pos, cls.POS_COLORS[pos]) if pos in cls._HIGHLIGHTABLE_POS else None
+        )
+        case_entry = None
+        if pos in cls._CASE_HIGHLIGHT_POS and case_value in cls._HIGHLIGHTABLE_CASE:
+            case_entry = (case_value, cls.CASE_COLORS[case_value])
+        number_entry = None
+        if (
+            pos in cls._NUMBER_HIGHLIGHT_POS
+            and number_value in cls._HIGHLIGHTABLE_NUMBER
+        ):
+            number_entry = (number_value, cls.NUMBER_COLORS[number_value])
+        return (pos_entry, case_entry, number_entry)
+
+    def _apply_cached_highlighting(
+        self, slot: int, selected: set[str] | None = None
+    ) -> None:
+        """
+        Highlight tokens using one slot of :attr:`_cached_colors`.
+
+        Args:
+            slot: Index into the cached ``(pos, case, number)`` tuple
+
+        Keyword Args:
+            selected: If given, only highlight keys in this set
+
+        """
+        text = self._oe_plain_text
         if not text or not self.tokens:
+            self._clear_all_highlights()
             return
 
-        extra_selections = []
-        for token in self.tokens:
-            if not token.id:
-                continue
-            annotation = self.annotations.get(cast("int", token.id))
-            if not annotation:
-                continue
+        selections_key = (
+            slot,
+            frozenset(selected) if selected is not None else None,
+            self._annotations_version,
+            text,
+        )
+        if selections_key == self._mode_selections_key:
+            # Nothing the selections depend on changed, so just restore them
+            self.oe_text_edit.setExtraSelections(self._mode_selections)
+            return
 
-            pos = annotation.pos
-            # Only highlight articles (D), nouns (N), pronouns (R),
-            # adjectives (A), and prepositions (E)
-            if pos not in ["D", "N", "R", "A", "E"]:
+        find_token_range = self._find_token_range
+        ranges: list[tuple[int, int, QColor]] = []
+        for token_idx, key, color in self._highlightable_tokens(slot):
+            if selected is not None and key not in selected:
                 continue
+            token_range = find_token_range(token_idx, text)
+            if token_range:
+                ranges.append((*token_range, color))
+
+        # This replaces any previous highlighting in a single update
+        self._mode_selections = self._build_highlight_selections(text, ranges)
+        self._mode_selections_key = selections_key
+        self.oe_text_edit.setExtraSelections(self._mode_selections)
+
+    def _highlightable_tokens(self, slot: int) -> list[tuple[int, str, QColor]]:
+        """
+        Get the tokens that are highlighted in one slot of :attr:`_cached_colors`.
+
+        Args:
+            slot: Index into the cached ``(pos, case, number)`` tuple
+
+        Returns:
+            ``(token position, key, color)`` for each highlighted token
 
-            # For prepositions, use prep_case; for others, use case
-            case_value = annotation.prep_case if pos == "E" else annotation.case
-            # Only highlight if case is in selected cases and not default
-            if case_value in self._selected_cases:
-                color = self.CASE_COLORS.get(case_value, self.CASE_COLORS[None])
-                # Only highlight if not default
-                if color != self.CASE_COLORS[None]:
-                    selection = self._create_token_selection(token, text, color)
-                    if selection:
-                        extra_selections.append(selection)
+        """
+        entries = self._highlightable.get(slot)
+        if entries is None:
+            entries = [
+                (token_idx, *colors[slot])
+                for token_idx, colors in enumerate(self._cached_colors)
+                if colors[slot] is not None
+            ]
+            self._highlightable[slot] = entries
+        return entries
+
+    def _apply_pos_highlighting(self) -> None:
+        """
+        Apply colors based on parts of speech.
+
+        Only highlights POS tags that are in the :attr:`_selected_pos` set.
+        """
+        self._apply_cached_highlighting(0, self._selected_pos)
+
+    def _apply_case_highlighting(self) -> None:
+        """
+        Apply colors based on case values.
 
-        self.oe_text_edit.setExtraSelections(extra_selections)
+        Highlights articles, nouns, pronouns, adjectives, and prepositions.
+        Only highlights cases that are in the :attr:`_selected_cases` set.
+        """
+        self._apply_cached_highlighting(1, self._selected_cases)
 
     def _apply_number_highlighting(self) -> None:
         """
         Apply colors based on number values.
 
-        Highlights articles, nouns, pronouns, and adjectives.
+        Highlights articles, nouns, pronouns, adjectives, and verbs.
         """
-        self._clear_all_highlights()
-        text = self.oe_text_edit.toPlainText()
-        if not text or not self.tokens:
-            return
+        self._apply_cached_highlighting(2)
 
-        extra_selections = []
-        for token in self.tokens:
-            if not token.id:
-                continue
-            annotation = self.annotations.get(cast("int", token.id))
-            if not annotation:
-                continue
+    def _find_token_range(self, token_idx: int, text: str) -> tuple[int, int] | None:
+        """
+        Find the character range of a token's surface text in the sentence.
 
-            pos = annotation.pos
-            # Only highlight articles (D), nouns (N), pronouns (R),
-            # and adjectives (A)
-            if pos not in ["D", "N", "R", "A", "V"]:
-                continue
+        Args:
+            token_idx: Index of the token in :attr:`tokens`
+            text: The full sentence text
 
-            number_value = annotation.number
-            color = self.NUMBER_COLORS.get(number_value, self.NUMBER_COLORS[None])
-            # Only highlight if not default
-            if color != self.NUMBER_COLORS[None]:
-                selection = self._create_token_selection(token, text, color)
-                if selection:
-                    extra_selections.append(selection)
+        Returns:
+            ``(start, end)`` tuple, or None if token not found
 
-        self.oe_text_edit.setExtraSelections(extra_selections)
+        """
+        self._get_token_spans(text)
+        return self._token_ranges.get(token_idx)
 
-    def _create_token_selection(
-        self, token: Token, text: str, color: QColor
-    ) -> QTextEdit.ExtraSelection | None:
+    def _build_highlight_selections(
+        self, text: str, ranges: list[tuple[int, int, QColor]]
+    ) -> list[QTextEdit.ExtraSelection]:
         """
-        Create an extra selection for highlighting a token's surface text.
+        Build extra selections for highlighting mode.
+
+        Runs of same-colored ranges separated only by whitespace are merged
+        into a single selection, so that Qt has fewer selections to lay out
+        and paint.
 
         Args:
-            token: Token to highlight
             text: The full sentence text
-            color: Color to use for highlighting
+            ranges: List of ``(start, end, color)`` tuples to highlight
 
         Returns:
-            ExtraSelection object or None if token not found
+            List of ExtraSelection objects
 
         """
-        surface = token.surface
-        if not surface:
-            return None
+        merged: list[tuple[int, int, QColor]] = []
+        for start, end, color in sorted(ranges, key=lambda r: r[0]):
+            if merged:
+                run_start, run_end, run_color = merged[-1]
+                if (
+                    (run_color is color or run_color.rgba() == color.rgba())
+                    and run_end <= start
+                    and not text[run_end:start].strip()
+                ):
+                    merged[-1] = (run_start, end, run_color)
+                    continue
+            merged.append((start, end, color))
 
-        # Find the occurrence position of this token
-        token_start = self._find_token_occurrence(text, token, self.tokens)
-        if token_start is None:
-            return None
+        return [
+            self._create_range_selection(start, end, color)
+            for start, end, color in merged
+        ]
 
+    def _create_range_selection(
+        self, start: int, end: int, color: QColor
+    ) -> QTextEdit.ExtraSelection:
+        """
+        Create an extra selection for highlighting a range of text.
+
+        Args:
+            start: Start character position (inclusive)
+            end: End character position (exclusive)
+            color: Color to use for highlighting
+
+        Returns:
+            ExtraSelection object
+
+        """
         # Create cursor and highlight the text
         cursor = QTextCursor(self.oe_text_edit.document())
-        cursor.setPosition(token_start)
-        cursor.movePosition(
-            QTextCursor.MoveOperation.Right,
-            QTextCursor.MoveMode.KeepAnchor,
-            len(surface),
-        )
-
-        # Apply highlight format
-        char_format = QTextCharFormat()
-        char_format.setBackground(color)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
-        # Create extra selection
+        # Create extra selection with the shared format for this color
         extra_selection = QTextEdit.ExtraSelection()
         extra_selection.cursor = cursor  # type: ignore[attr-defined]
-        extra_selection.format = char_format  # type: ignore[attr-defined]
+        extra_selection.format = _background_format(color)  # type: ignore[attr-defined]
 
         return extra_selection
 
     def _clear_all_highlights(self) -> None:
         """Clear all highlighting from the text."""
+        self._mode_selections = []
+        self._mode_selections_key = None
         self.oe_text_edit.setExtraSelections([])
 
     def _clear_highlight(self) -> None:
@@ -1179,25 +1648,8 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             or self._current_highlight_length is None
         ):
             return
-        # Get existing selections and filter out the selection highlight
-        # (we identify it by checking if it matches our stored position)
-        existing_selections = self.oe_text_edit.extraSelections()
-        filtered_selections = []
-
-        for selection in existing_selections:
-            cursor = selection.cursor  # type: ignore[attr-defined]
-            # Check if this is the selection highlight (yellow) by position
-            if (
-                cursor.position() >= self._current_highlight_start
-                and cursor.position()
-                <= self._current_highlight_start + self._current_highlight_length
-            ):
-                # This is the selection highlight, skip it
-                continue
-            # Keep highlighting mode selections
-            filtered_selections.append(selection)
-
-        self.oe_text_edit.setExtraSelections(filtered_selections)
+        # Only the highlighting mode selections remain
+        self.oe_text_edit.setExtraSelections(self._mode_selections)
         self._current_highlight_start = None
         self._current_highlight_length = None
 
@@ -1209,79 +1661,14 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             token: Token to highlight
 
         """
-        # Clear any existing highlight first
-        self._clear_highlight()
-
-        # Get the text from the editor
-        text = self.oe_text_edit.toPlainText()
-        if not text:
-            return
-
-        # Get the token surface text
-        surface = token.surface
-        if not surface:
-            return
-
-        # Find all occurrences of the surface text
-        occurrences = []
-        start = 0
-        while True:
-            pos = text.find(surface, start)
-            if pos == -1:
-                break
-            occurrences.append(pos)
-            start = pos + 1
-
-        # If no occurrences found, return
-        if not occurrences:
-            return
-
-        # Use order_index to determine which occurrence to highlight
-        # Count how many tokens with the same surface appear before this one
-        same_surface_count = 0
-        for t in self.tokens:
-            if t.order_index >= token.order_index:
-                break
-            if t.surface == surface:
-                same_surface_count += 1
-
-        # Select the occurrence at the same_surface_count index
-        if same_surface_count < len(occurrences):
-            highlight_pos = occurrences[same_surface_count]
-        else:
-            # Fallback to first occurrence if index is out of range
-            highlight_pos = occurrences[0]
-
-        # Get existing extra selections (for highlighting mode)
-        existing_selections = self.oe_text_edit.extraSelections()
-
-        # Create cursor and highlight the text using extraSelections
-        cursor = QTextCursor(self.oe_text_edit.document())
-        cursor.setPosition(highlight_pos)
-        cursor.movePosition(
-            QTextCursor.MoveOperation.Right,
-            QTextCursor.MoveMode.KeepAnchor,
-            len(surface),
-        )
-
-        # Apply highlight format for selection (yellow, semi-transparent)
-        char_format = QTextCharFormat()
-        # Use a yellow background color with transparency
-        char_format.setBackground(QColor(200, 200, 0, 150))
-
-        # Use extraSelections for temporary highlighting
-        selection_highlight = QTextEdit.ExtraSelection()
-        selection_highlight.cursor = cursor  # type: ignore[attr-defined]
-        selection_highlight.format = char_format  # type: ignore[attr-defined]
-
-        # Combine existing selections (from highlighting mode)
-        # with the selection highlight
-        all_selections = [*existing_selections, selection_highlight]
-        self.oe_text_edit.setExtraSelections(all_selections)
-
-        # Store position for reference
-        self._current_highlight_start = highlight_pos
-        self._current_highlight_length = len(surface)
+        # Look the token up in the cached token spans, which already pair each
+        # token with its own occurrence of a repeated surface
+        text = self._oe_plain_text
+        token_idx = self._token_index.get(token.id)
+        token_range = None
+        if text and token.surface and token_idx is not None:
+            token_range = self._find_token_range(token_idx, text)
+        self._show_selection_highlights([token_range] if token_range else [])
 
     def _highlight_token_range(self, start_index: int, end_index: int) -> None:
         """
@@ -1292,112 +1679,98 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             end_index: Ending token index (inclusive)
 
         """
-        # Clear any existing highlight first
-        self._clear_highlight()
-
-        # Get the text from the editor
-        text = self.oe_text_edit.toPlainText()
-        if not text or not self.tokens:
-            return
-
-        # Validate indices
-        if start_index < 0 or end_index >= len(self.tokens) or start_index > end_index:
-            return
-
-        # Get existing extra selections (for highlighting mode)
-        existing_selections = self.oe_text_edit.extraSelections()
-
-        # Build list of token positions
+        # Build list of token positions from the cached token spans, which
+        # locate every token surface in a single pass over the text
+        text = self._oe_plain_text
         token_positions: list[tuple[int, int]] = []  # (start_pos, end_pos)
-        for token_idx in range(start_index, end_index + 1):
-            token = self.tokens[token_idx]
-            surface = token.surface
-            if not surface:
-                continue
+        if text and 0 <= start_index <= end_index < len(self.tokens):
+            find_token_range = self._find_token_range
+            for token_idx in range(start_index, end_index + 1):
+                token_range = find_token_range(token_idx, text)
+                if token_range is not None:
+                    token_positions.append(token_range)
+        self._show_selection_highlights(token_positions)
+
+    def _show_selection_highlights(
+        self, token_positions: list[tuple[int, int]]
+    ) -> None:
+        """
+        Replace the temporary selection highlight (yellow) with new ranges.
+
+        The highlighting mode selections are kept underneath, and the new
+        highlight replaces the old one in a single update.  If there are no
+        ranges, the current selection highlight is just cleared.
 
-            token_start = self._find_token_occurrence(text, token, self.tokens)
-            if token_start is not None:
-                token_end = token_start + len(surface)
-                token_positions.append((token_start, token_end))
+        Args:
+            token_positions: ``(start, end)`` character ranges to highlight, in
+                text order
 
+        """
         if not token_positions:
+            self._clear_highlight()
             return
 
-        # Create highlights for all tokens in range
-        range_highlights = []
-        for token_start, token_end in token_positions:
-            cursor = QTextCursor(self.oe_text_edit.document())
-            cursor.setPosition(token_start)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Right,
-                QTextCursor.MoveMode.KeepAnchor,
-                token_end - token_start,
-            )
-
-            # Apply highlight format for selection (yellow, semi-transparent)
-            char_format = QTextCharFormat()
-            char_format.setBackground(QColor(200, 200, 0, 150))
-
-            selection_highlight = QTextEdit.ExtraSelection()
-            selection_highlight.cursor = cursor  # type: ignore[attr-defined]
-            selection_highlight.format = char_format  # type: ignore[attr-defined]
-            range_highlights.append(selection_highlight)
+        # Create yellow, semi-transparent highlights for all the ranges
+        range_highlights = [
+            self._create_range_selection(token_start, token_end, _SELECTION_COLOR)
+            for token_start, token_end in token_positions
+        ]
 
-        # Combine existing selections with range highlights
-        all_selections = [*existing_selections, *range_highlights]
-        self.oe_text_edit.setExtraSelections(all_selections)
+        # Combine the highlighting mode selections with the range highlights
+        self.oe_text_edit.setExtraSelections(
+            [*self._mode_selections, *range_highlights]
+        )
 
         # Store range for clearing later
-        if token_positions:
-            first_start = token_positions[0][0]
-            last_end = token_positions[-1][1]
-            self._current_highlight_start = first_start
-            self._current_highlight_length = last_end - first_start
+        first_start = token_positions[0][0]
+        self._current_highlight_start = first_start
+        self._current_highlight_length = token_positions[-1][1] - first_start
 
-    def _save_annotation(self, annotation: Annotation) -> None:
+    def _save_annotation(self, annotation: Annotation) -> Annotation:
         """
         Save annotation to database.
 
         Args:
             annotation: Annotation to save
 
+        Returns:
+            The saved annotation as stored in the session
+
+        """
+        return self._save_annotations([annotation])[0]
+
+    def _save_annotations(self, annotations: list[Annotation]) -> list[Annotation]:
+        """
+        Save several annotations to the database in a single transaction.
+
+        The transaction is committed by :meth:`_commit_annotations` once no
+        more annotations have been saved for :attr:`ANNOTATION_COMMIT_MS`
+        milliseconds, or by :meth:`flush_pending_edits`.
+
+        Args:
+            annotations: Annotations to save
+
+        Returns:
+            The saved annotations as stored in the session, in the same order
+            as ``annotations``
+
         """
         if not self.session:
-            return
+            return annotations
 
-        # Check if annotation exists
-        existing = Annotation.get(self.session, annotation.token_id)
-        if existing:
-            # Update existing annotation
-            existing.pos = annotation.pos
-            existing.gender = annotation.gender
-            existing.number = annotation.number
-            existing.case = annotation.case
-            existing.declension = annotation.declension
-            existing.pronoun_type = annotation.pronoun_type
-            existing.pronoun_number = annotation.pronoun_number
-            existing.verb_class = annotation.verb_class
-            existing.verb_tense = annotation.verb_tense
-            existing.verb_person = annotation.verb_person
-            existing.verb_mood = annotation.verb_mood
-            existing.verb_aspect = annotation.verb_aspect
-            existing.verb_form = annotation.verb_form
-            existing.prep_case = annotation.prep_case
-            existing.uncertain = annotation.uncertain
-            existing.adverb_degree = annotation.adverb_degree
-            existing.adjective_inflection = annotation.adjective_inflection
-            existing.adjective_degree = annotation.adjective_degree
-            existing.conjunction_type = annotation.conjunction_type
-            existing.alternatives_json = annotation.alternatives_json
-            existing.confidence = annotation.confidence
-            existing.modern_english_meaning = annotation.modern_english_meaning
-            existing.root = annotation.root
-            self.session.add(existing)
-        else:
-            # Insert new annotation
-            self.session.add(annotation)
+        # Insert each annotation, or copy its state onto the stored annotation
+        # for the same token.  Stored annotations already loaded by this card
+        # are found in the session's identity map without another SELECT.
+        saved = [self.session.merge(annotation) for annotation in annotations]
+        self._annotation_commit_timer.start()
+        return saved
 
-        self.session.commit()
+    def _commit_annotations(self) -> None:
+        """
+        Commit the annotations saved by :meth:`_save_annotations`.
+        """
+        if self.session:
+            self.session.commit()
 
     def _on_add_note_clicked(self) -> None:
         """
@@ -1573,29 +1946,14 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             self.oe_text_edit.setPlainText(text)
             return
 
-        # Build token positions map
-        # Track which positions we've already used to avoid duplicates
-        used_positions: set[tuple[int, int]] = set()  # (start, end) positions
-        token_positions: list[tuple[int, int, int]] = []  # (start, end, token_id)
-
-        # Sort tokens by order_index to process them in order
-        sorted_tokens = sorted(self.tokens, key=lambda t: t.order_index)
-
-        for token in sorted_tokens:
-            if not token.id or not token.surface:
-                continue
-            token_start = self._find_token_occurrence(text, token, self.tokens)
-            if token_start is not None:
-                token_end = token_start + len(token.surface)
-                position_key = (token_start, token_end)
-
-                # Only add if this position hasn't been used yet
-                if position_key not in used_positions:
-                    token_positions.append((token_start, token_end, token.id))
-                    used_positions.add(position_key)
-
-        # Sort by position
-        token_positions.sort(key=lambda x: x[0])
+        # Token positions come from the cached per-sentence span table, which
+        # is already sorted by position and free of overlaps
+        tokens = self.tokens
+        token_positions: list[tuple[int, int, int]] = [  # (start, end, token_id)
+            (token_start, token_end, tokens[token_idx].id)
+            for token_start, token_end, token_idx in self._get_token_spans(text)
+            if tokens[token_idx].id
+        ]
 
         # Build HTML
         last_pos = 0
@@ -1907,6 +2265,21 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
                 "Failed to delete sentence. Please try again.",
             )
 
+    def flush_pending_edits(self) -> None:
+        """
+        Immediately apply any text changes still waiting on their debounce timer,
+        and commit any saved annotations that are still waiting to be committed.
+        """
+        if self._oe_text_debounce.isActive():
+            self._oe_text_debounce.stop()
+            self._commit_oe_text_change()
+        if self._translation_debounce.isActive():
+            self._translation_debounce.stop()
+            self._commit_translation_change()
+        if self._annotation_commit_timer.isActive():
+            self._annotation_commit_timer.stop()
+            self._commit_annotations()
+
     def get_oe_text(self) -> str:
         """
         Get Old English text.
@@ -1915,7 +2288,7 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             Old English text string
 
         """
-        return self.oe_text_edit.toPlainText()
+        return self._oe_plain_text
 
     def get_translation(self) -> str:
         """
@@ -1958,8 +2331,13 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
             # Reset edit mode state
             self._oe_edit_mode = False
             self._original_oe_text = None
-        self.oe_text_edit.setText(sentence.text_oe)
-        self.translation_edit.setPlainText(sentence.text_modern or "")
+        # Syncing the text boxes from the model is not an edit, so keep it
+        # from re-entering the edit handlers
+        with QSignalBlocker(self.oe_text_edit):
+            self.oe_text_edit.setText(sentence.text_oe)
+        with QSignalBlocker(self.translation_edit):
+            self.translation_edit.setPlainText(sentence.text_modern or "")
+        self._invalidate_oe_plain_text()
 
     def focus(self) -> None:
         """
@@ -1978,8 +2356,10 @@ class SentenceCard(TokenOccurrenceMixin, QWidget):
         """
         Unfocus this sentence card.
         """
-        self.token_table.table.clearFocus()
-        self.token_table.select_token(0)
+        if self._token_table is None:
+            return
+        self._token_table.table.clearFocus()
+        self._token_table.select_token(0)
 
     def _perform_deselection(self) -> None:
         """
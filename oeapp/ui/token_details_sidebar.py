@@ -1,11 +1,22 @@
 """Token details sidebar widget."""
 
 import re
-from typing import TYPE_CHECKING, Final, cast
+from contextlib import contextmanager
+from functools import cache, lru_cache
+from html import escape
+from typing import TYPE_CHECKING, Any, Final, cast
 from urllib.parse import quote
 
-from PySide6.QtCore import Qt, QUrl
-from PySide6.QtGui import QDesktopServices, QFont, QIcon, QPainter, QPixmap
+from PySide6.QtCore import Qt, QTimer, QUrl
+from PySide6.QtGui import (
+    QDesktopServices,
+    QFont,
+    QHideEvent,
+    QIcon,
+    QPainter,
+    QPixmap,
+    QShowEvent,
+)
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -19,11 +30,34 @@ from PySide6.QtWidgets import (
 from oeapp.ui.mixins import AnnotationLookupsMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from oeapp.models.annotation import Annotation
     from oeapp.models.sentence import Sentence
     from oeapp.models.token import Token
 
 
+@cache
+def _font(
+    family: str, point_size: int, weight: QFont.Weight = QFont.Weight.Normal
+) -> QFont:
+    """
+    Get a shared :class:`QFont`, so each font is only constructed once.
+
+    Args:
+        family: Font family
+        point_size: Point size
+
+    Keyword Args:
+        weight: Font weight
+
+    Returns:
+        The shared font
+
+    """
+    return QFont(family, point_size, weight)
+
+
 class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
     """
     Sidebar widget displaying detailed token information.  The sidebar displays
@@ -56,11 +90,106 @@ class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
 <path d="M21 6l0 13" />
 </svg>"""  # noqa: E501
 
+    #: Style sheet for a field label whose value is not set.
+    UNSET_FIELD_STYLE: Final[str] = "color: #999; font-style: italic;"
+    #: Style sheet for a field label whose value is set.
+    SET_FIELD_STYLE: Final[str] = (
+        "color: #000; font-family: Helvetica; font-weight: normal;"
+    )
+    #: Style sheet for the superscript and subscript annotation marks around
+    #: the token surface.
+    ANNOTATION_MARK_STYLE: Final[str] = (
+        "color: #666; font-family: Helvetica; font-weight: normal;"
+    )
+    #: Template for a superscript annotation mark in the token header.
+    SUPERSCRIPT_TEMPLATE: Final[str] = (
+        f"<sup style='{ANNOTATION_MARK_STYLE}'>{{}}</sup>"
+    )
+    #: Template for a subscript annotation mark in the token header.
+    SUBSCRIPT_TEMPLATE: Final[str] = f"<sub style='{ANNOTATION_MARK_STYLE}'>{{}}</sub>"
+    #: Text of a horizontal rule.
+    SEPARATOR_TEXT: Final[str] = "─" * 30
+    #: Style sheet for a horizontal rule.
+    SEPARATOR_STYLE: Final[str] = (
+        "color: #ccc; font-family: Helvetica; font-weight: normal;"
+    )
+    #: Delay in milliseconds (about one frame) used to coalesce bursts of
+    #: :meth:`update_token` calls, e.g. while arrowing through tokens
+    UPDATE_COALESCE_MS: Final[int] = 16
+    #: The POS-specific fields displayed for each POS code, in display order.
+    #: POS codes without any such fields are left out.
+    #: Each row is ``(field name, lookup map attribute, annotation attribute,
+    #: bold)``.
+    POS_FIELD_ROWS: Final[dict[str, tuple[tuple[str, str, str, bool], ...]]] = {
+        "N": (
+            ("Gender", "GENDER_MAP", "gender", False),
+            ("Number", "NUMBER_MAP", "number", False),
+            ("Case", "CASE_MAP", "case", True),
+            ("Declension", "DECLENSION_MAP", "declension", False),
+        ),
+        "V": (
+            ("Verb Class", "VERB_CLASS_MAP", "verb_class", False),
+            ("Tense", "VERB_TENSE_MAP", "verb_tense", False),
+            ("Mood", "VERB_MOOD_MAP", "verb_mood", False),
+            ("Person", "VERB_PERSON_MAP", "verb_person", False),
+            ("Number", "NUMBER_MAP", "number", False),
+            ("Aspect", "VERB_ASPECT_MAP", "verb_aspect", False),
+            ("Form", "VERB_FORM_MAP", "verb_form", False),
+        ),
+        "A": (
+            ("Gender", "GENDER_MAP", "gender", False),
+            ("Number", "NUMBER_MAP", "number", False),
+            ("Case", "CASE_MAP", "case", False),
+        ),
+        "R": (
+            ("Pronoun Type", "PRONOUN_TYPE_MAP", "pronoun_type", False),
+            ("Gender", "GENDER_MAP", "gender", False),
+            ("Number", "PRONOUN_NUMBER_MAP", "pronoun_number", False),
+            ("Case", "CASE_MAP", "case", False),
+        ),
+        "D": (
+            ("Article Type", "ARTICLE_TYPE_MAP", "article_type", False),
+            ("Gender", "GENDER_MAP", "gender", False),
+            ("Number", "NUMBER_MAP", "number", False),
+            ("Case", "CASE_MAP", "case", False),
+        ),
+        "E": (("Governed Case", "PREPOSITION_CASE_MAP", "prep_case", False),),
+        # Adverbs (B), conjunctions (C) and interjections (I) have no
+        # POS-specific fields
+    }
+    #: Number of reusable field labels, all created up front by
+    #: :meth:`_setup_details`.  This is the most POS-specific fields any part
+    #: of speech displays.
+    MAX_FIELDS: Final[int] = max(map(len, POS_FIELD_ROWS.values()))
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the token details sidebar."""
         super().__init__(parent)
         self._current_token: Token | None = None
         self._current_sentence: Sentence | None = None
+        # Index of the next unused label in :attr:`_field_labels` while the
+        # POS-specific fields are being displayed
+        self._next_field: int = 0
+        # Root value the dictionary button searches for
+        self._root_value: str | None = None
+        # What the sidebar currently displays, from :meth:`_display_key`
+        self._displayed_key: tuple[Any, ...] | None = None
+        # Style sheet constant last applied to each field label by
+        # :meth:`_format_field_label`
+        self._label_styles: dict[QLabel, str] = {}
+        # Text last given to each label by :meth:`_set_label_text`
+        self._label_texts: dict[QLabel, str] = {}
+        # Token and sentence from the latest :meth:`update_token` call that
+        # arrived while the previous update was still within its frame
+        self._pending_update: tuple[Token, Sentence] | None = None
+        # Timer that applies :attr:`_pending_update` at the end of the frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_COALESCE_MS)
+        self._update_timer.timeout.connect(self.flush_pending_update)
+        # Whether the sidebar has been hidden (e.g. its window is minimized);
+        # updates are then deferred until it is shown again
+        self._hidden: bool = False
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -76,7 +205,24 @@ class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
         # Content widget
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        # Empty state with centered 'Word details' text
+        self._empty_widget = QWidget()
+        empty_layout = QVBoxLayout(self._empty_widget)
+        empty_layout.setContentsMargins(0, 0, 0, 0)
+        empty_label = QLabel("Word details")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_label.setFont(_font("Arial", 16))
+        empty_label.setStyleSheet("color: #666;")
+        empty_layout.addStretch()
+        empty_layout.addWidget(empty_label)
+        empty_layout.addStretch()
+        self.content_layout.addWidget(self._empty_widget)
+
+        # Token details, built once and updated in place for each token
+        self._details_widget = QWidget()
+        self._setup_details(self._details_widget)
+        self.content_layout.addWidget(self._details_widget)
 
         scroll_area.setWidget(self.content_widget)
         layout.addWidget(scroll_area)
@@ -84,26 +230,155 @@ class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
         # Show empty state initially
         self._show_empty_state()
 
-    def _show_empty_state(self) -> None:
-        """Show empty state with centered 'Word details' text."""
-        self._clear_content()
+    def _setup_details(self, details_widget: QWidget) -> None:
+        """
+        Build the widgets that display a token's details.
 
-        empty_label = QLabel("Word details")
-        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_label.setFont(QFont("Arial", 16))
-        empty_label.setStyleSheet("color: #666;")
+        Args:
+            details_widget: Widget to build the details in
+
+        """
+        details_layout = QVBoxLayout(details_widget)
+        details_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Paragraph/sentence number label on its own line
+        self._number_label = QLabel()
+        self._number_label.setFont(_font("Helvetica", 12, QFont.Weight.Bold))
+        self._number_label.setStyleSheet("color: #333;")
+        details_layout.addWidget(self._number_label)
+
+        # Horizontal rule
+        details_layout.addWidget(self._make_separator())
+
+        # Token surface with annotations
+        self._token_label = QLabel()
+        self._token_label.setFont(_font("Anvers", 18, QFont.Weight.Bold))
+        self._token_label.setWordWrap(True)
+        # The header is always markup, so don't make Qt guess its format
+        self._token_label.setTextFormat(Qt.TextFormat.RichText)
+        details_layout.addWidget(self._token_label)
+
+        details_layout.addSpacing(10)
+
+        # Shown instead of the annotation when there is no annotation or POS
+        self._no_annotation_label = QLabel("No annotation available")
+        self._no_annotation_label.setStyleSheet(self.UNSET_FIELD_STYLE)
+        details_layout.addWidget(self._no_annotation_label)
+
+        # Annotation details
+        self._annotation_widget = QWidget()
+        annotation_layout = QVBoxLayout(self._annotation_widget)
+        annotation_layout.setContentsMargins(0, 0, 0, 0)
+
+        # POS
+        self._pos_label = QLabel()
+        self._pos_label.setFont(_font("Helvetica", 12, QFont.Weight.Bold))
+        annotation_layout.addWidget(self._pos_label)
+        annotation_layout.addSpacing(5)
+
+        # POS-specific fields, filled in order by :meth:`_add_field`
+        self._field_labels: list[QLabel] = []
+        for _ in range(self.MAX_FIELDS):
+            field_label = QLabel()
+            annotation_layout.addWidget(field_label)
+            self._field_labels.append(field_label)
+        # Whether each field label currently has the bold font
+        self._field_bold: list[bool] = [False] * self.MAX_FIELDS
+        self._field_font = self._field_labels[0].font()
+
+        # Common fields for all POS
+        annotation_layout.addSpacing(10)
+        annotation_layout.addWidget(self._make_separator())
+        annotation_layout.addSpacing(10)
+        self._setup_common_fields(annotation_layout)
+
+        details_layout.addWidget(self._annotation_widget)
+        details_layout.addStretch()
+
+    def _setup_common_fields(self, layout: QVBoxLayout) -> None:
+        """
+        Build the labels for the fields common to all POS types.
+
+        Args:
+            layout: Layout to add the labels to
+
+        """
+        # Root, with a dictionary icon button shown if the root is not empty
+        self._root_label = QLabel()
+        self._dict_button = QPushButton()
+        self._dict_button.setIcon(self._get_book_icon(self.BOOK_ICON_SIZE))
+        self._dict_button.setToolTip("Open in Bosworth-Toller dictionary")
+        self._dict_button.setFlat(True)
+        self._dict_button.setStyleSheet(
+            "QPushButton { border: none; padding: 2px; } "
+            "QPushButton:hover { background-color: #f0f0f0; border-radius: 3px; }"
+        )
+        self._dict_button.clicked.connect(self._on_dict_button_clicked)
+        root_layout = QHBoxLayout()
+        root_layout.setContentsMargins(0, 0, 0, 0)
+        root_layout.addWidget(self._root_label)
+        root_layout.addWidget(self._dict_button)
+        root_layout.addStretch()
+        root_widget = QWidget()
+        root_widget.setLayout(root_layout)
+        layout.addWidget(root_widget)
+
+        # Modern English Meaning
+        self._mod_e_label = QLabel()
+        self._mod_e_label.setFont(_font("Helvetica", 12, QFont.Weight.Bold))
+        layout.addWidget(self._mod_e_label)
+
+        # Uncertainty
+        self._uncertain_label = QLabel()
+        layout.addWidget(self._uncertain_label)
+
+        # Alternatives
+        self._alternatives_label = QLabel()
+        layout.addWidget(self._alternatives_label)
+
+        # Confidence
+        self._confidence_label = QLabel()
+        layout.addWidget(self._confidence_label)
+
+    def _make_separator(self) -> QLabel:
+        """
+        Create a horizontal rule label.
+
+        Returns:
+            The separator label
+
+        """
+        separator = QLabel(self.SEPARATOR_TEXT)
+        separator.setStyleSheet(self.SEPARATOR_STYLE)
+        return separator
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """
+        Suspend repaints of the content while several updates are made.
 
-        self.content_layout.addStretch()
-        self.content_layout.addWidget(empty_label)
-        self.content_layout.addStretch()
+        On exit, updates are re-enabled and the layout is activated once for
+        everything changed inside the block.
+
+        Yields:
+            Nothing
+
+        """
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.content_layout.activate()
+            self.content_widget.setUpdatesEnabled(True)
 
-    def _clear_content(self) -> None:
-        """Clear all content from the sidebar."""
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+    def _show_empty_state(self) -> None:
+        """Show empty state with centered 'Word details' text."""
+        # Clearing an empty sidebar would only re-activate the layout
+        if self._details_widget.isHidden() and not self._empty_widget.isHidden():
+            return
+        with self._batch_updates():
+            self._details_widget.setVisible(False)
+            self._empty_widget.setVisible(True)
 
     def _get_book_icon(self, size: int = 16) -> QIcon:
         """
@@ -148,19 +423,117 @@ class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
         # Open in default browser
         QDesktopServices.openUrl(url)
 
-    def update_token(self, token: Token, sentence: Sentence) -> None:  # noqa: PLR0912, PLR0915
+    def _on_dict_button_clicked(self) -> None:
+        """Open the dictionary entry for the displayed root value."""
+        if self._root_value:
+            self._open_bosworth_toller(self._root_value)
+
+    def update_token(self, token: Token, sentence: Sentence) -> None:
         """
         Update the sidebar with token details.
 
+        The first update is displayed immediately.  Further updates that
+        arrive within :attr:`UPDATE_COALESCE_MS` of it are coalesced, and only
+        the latest of them is displayed when the timer fires.  While the
+        sidebar is hidden, only the latest update is kept, and it is displayed
+        when the sidebar is shown again.
+
         Args:
             token: Token to display
             sentence: Sentence containing the token
 
         """
+        if self._hidden or self._update_timer.isActive():
+            self._pending_update = (token, sentence)
+            return
+        self._apply_update(token, sentence)
+        self._update_timer.start()
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        """
+        Handle show event.
+
+        Displays the latest token selected while the sidebar was hidden.
+
+        Args:
+            event: Show event
+
+        """
+        super().showEvent(event)
+        self._hidden = False
+        self.flush_pending_update()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        """
+        Handle hide event.
+
+        Args:
+            event: Hide event
+
+        """
+        super().hideEvent(event)
+        self._hidden = True
+
+    def flush_pending_update(self) -> None:
+        """Immediately display any update still waiting on the coalescing timer."""
+        self._update_timer.stop()
+        if self._pending_update is not None:
+            token, sentence = self._pending_update
+            self._pending_update = None
+            self._apply_update(token, sentence)
+
+    def _apply_update(self, token: Token, sentence: Sentence) -> None:
+        """
+        Display the details of a token, unless they are already displayed.
+
+        Args:
+            token: Token to display
+            sentence: Sentence containing the token
+
+        """
+        annotation = token.annotation
+        values = self._annotation_values(annotation) if annotation is not None else None
+        # Selection events often re-select the token that is already shown
+        display_key = self._display_key(token, sentence, values)
+        if display_key == self._displayed_key:
+            return
+        self._displayed_key = display_key
         self._current_token = token
         self._current_sentence = sentence
-        self._clear_content()
+        with self._batch_updates():
+            self._display_token(token, sentence, values)
+
+    @staticmethod
+    def _annotation_values(annotation: Annotation) -> dict[str, Any]:
+        """
+        Read every annotation field the sidebar displays in one pass.
 
+        The fields are read once per update, and the displays then look them
+        up in a plain dictionary instead of going through the mapped
+        attributes again.
+
+        Args:
+            annotation: Annotation to read
+
+        Returns:
+            Dictionary mapping field names to their values
+
+        """
+        return annotation.state_snapshot() | {"article_type": annotation.article_type}
+
+    def _display_token(
+        self, token: Token, sentence: Sentence, values: dict[str, Any] | None
+    ) -> None:
+        """
+        Display the details of a token.
+
+        Args:
+            token: Token to display
+            sentence: Sentence containing the token
+            values: The token's annotation fields from
+                :meth:`_annotation_values`, or ``None`` if it has no annotation
+
+        """
         annotation = cast("Annotation", token.annotation)
         pos_str = ""
         gender_str = ""
@@ -173,394 +546,267 @@ class TokenDetailsSidebar(AnnotationLookupsMixin, QWidget):
         # Paragraph/sentence number label on its own line
         paragraph_num = sentence.paragraph_number
         sentence_num = sentence.sentence_number_in_paragraph
-        number_label = QLabel(
-            f"[{sentence.display_order}] ¶:{paragraph_num} S:{sentence_num}"
+        self._set_label_text(
+            self._number_label,
+            f"[{sentence.display_order}] ¶:{paragraph_num} S:{sentence_num}",
         )
-        number_label.setFont(QFont("Helvetica", 12, QFont.Weight.Bold))
-        number_label.setStyleSheet("color: #333;")
-        self.content_layout.addWidget(number_label)
 
-        # Horizontal rule
-        separator = QLabel("─" * 30)
-        separator.setStyleSheet(
-            "color: #ccc; font-family: Helvetica; font-weight: normal;"
+        # Token surface with annotations
+        self._set_label_text(
+            self._token_label,
+            self._header_html(pos_str, gender_str, token.surface, context_str),
         )
-        self.content_layout.addWidget(separator)
 
-        # Token surface with annotations
-        style = "color: #666; font-family: Helvetica; font-weight: normal;"
-        token_text = ""
-        if pos_str:
-            token_text += f"<sup style='{style}'>{pos_str}</sup>"
-        if gender_str:
-            token_text += f"<sub style='{style}'>{gender_str}</sub>"
-        token_text += f"{token.surface}"
-        if context_str:
-            token_text += f"<sub style='{style}'>{context_str}</sub>"
-        token_label = QLabel(token_text)
-        token_label.setFont(QFont("Anvers", 18, QFont.Weight.Bold))
-        token_label.setWordWrap(True)
-        self.content_layout.addWidget(token_label)
-
-        self.content_layout.addSpacing(10)
-
-        if not annotation or not annotation.pos:
+        self._empty_widget.setVisible(False)
+        self._details_widget.setVisible(True)
+
+        if values is None or not values["pos"]:
             # No annotation or POS set
-            no_pos_label = QLabel("No annotation available")
-            no_pos_label.setStyleSheet("color: #999; font-style: italic;")
-            self.content_layout.addWidget(no_pos_label)
+            self._annotation_widget.setVisible(False)
+            self._no_annotation_label.setVisible(True)
             return
+        self._no_annotation_label.setVisible(False)
 
         # Display POS
-        pos_text = self.PART_OF_SPEECH_MAP.get(annotation.pos, "Unknown")
-        if pos_text:
-            pos_label = QLabel(f"Part of Speech: {pos_text}")
-            pos_label.setFont(QFont("Helvetica", 12, QFont.Weight.Bold))
-            self.content_layout.addWidget(pos_label)
-            self.content_layout.addSpacing(5)
+        pos = values["pos"]
+        pos_text = self.PART_OF_SPEECH_MAP.get(pos, "Unknown")
+        self._set_label_text(self._pos_label, f"Part of Speech: {pos_text}")
+        self._pos_label.setVisible(bool(pos_text))
 
         # Display POS-specific fields
-        if annotation.pos == "N":
-            self._display_noun_fields(annotation)
-        elif annotation.pos == "V":
-            self._display_verb_fields(annotation)
-        elif annotation.pos == "A":
-            self._display_adjective_fields(annotation)
-        elif annotation.pos == "R":
-            self._display_pronoun_fields(annotation)
-        elif annotation.pos == "D":
-            self._display_article_fields(annotation)
-        elif annotation.pos == "E":
-            self._display_preposition_fields(annotation)
-        elif annotation.pos == "B":
-            self._display_adverb_fields(annotation)
-        elif annotation.pos == "C":
-            self._display_conjunction_fields(annotation)
-        elif annotation.pos == "I":
-            self._display_interjection_fields(annotation)
+        self._next_field = 0
+        rows = self.POS_FIELD_ROWS.get(pos)
+        if rows is not None:
+            self._emit_rows(values, rows)
+        # Hide the field labels this POS did not use
+        for field_label in self._field_labels[self._next_field :]:
+            field_label.setVisible(False)
 
         # Common fields for all POS
-        self.content_layout.addSpacing(10)
-        separator = QLabel("─" * 30)
-        separator.setStyleSheet(
-            "color: #ccc; font-family: Helvetica; font-weight: normal;"
-        )
-        self.content_layout.addWidget(separator)
-        self.content_layout.addSpacing(10)
-
-        self._display_common_fields(annotation)
+        self._display_common_fields(values)
 
-        self.content_layout.addStretch()
+        self._annotation_widget.setVisible(True)
 
-    def _display_common_fields(self, annotation: Annotation) -> None:
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _header_html(
+        cls, pos_str: str, gender_str: str, surface: str, context_str: str
+    ) -> str:
         """
-        Display fields common to all POS types.
+        Build the rich text of the token header.
+
+        The surface is escaped, so that characters like ``<`` and ``&`` in it
+        are shown rather than parsed as markup.  Headers are cached, so
+        re-selecting a token reuses the same string.
 
         Args:
-            annotation: Annotation to display
+            pos_str: Short POS shown as a superscript before the surface
+            gender_str: Gender shown as a subscript before the surface
+            surface: Token surface
+            context_str: Context (e.g. case and number) shown as a subscript
+                after the surface
 
-        """
-        # Root
-        root_value = annotation.root if annotation.root else "?"
-        root_label = QLabel(f"Root: {root_value}")
-        self._format_field_label(root_label, annotation.root)
+        Returns:
+            The header markup
 
-        # Create horizontal layout for root field with optional dictionary icon
-        root_layout = QHBoxLayout()
-        root_layout.setContentsMargins(0, 0, 0, 0)
-        root_layout.addWidget(root_label)
-
-        # Add dictionary icon button if root is not empty
-        if annotation.root:
-            dict_button = QPushButton()
-            dict_button.setIcon(self._get_book_icon(self.BOOK_ICON_SIZE))
-            dict_button.setToolTip("Open in Bosworth-Toller dictionary")
-            dict_button.setFlat(True)
-            dict_button.setStyleSheet(
-                "QPushButton { border: none; padding: 2px; } "
-                "QPushButton:hover { background-color: #f0f0f0; border-radius: 3px; }"
-            )
-            dict_button.clicked.connect(
-                lambda _checked=False, rv=annotation.root: self._open_bosworth_toller(
-                    rv
-                )
+        """
+        return "".join(
+            (
+                cls.SUPERSCRIPT_TEMPLATE.format(pos_str) if pos_str else "",
+                cls.SUBSCRIPT_TEMPLATE.format(gender_str) if gender_str else "",
+                escape(surface),
+                cls.SUBSCRIPT_TEMPLATE.format(context_str) if context_str else "",
             )
-            root_layout.addWidget(dict_button)
-            root_layout.addStretch()
-
-        # Create a widget to hold the layout
-        root_widget = QWidget()
-        root_widget.setLayout(root_layout)
-        self.content_layout.addWidget(root_widget)
-
-        # Modern English Meaning
-        mod_e_value = (
-            annotation.modern_english_meaning
-            if annotation.modern_english_meaning
-            else "?"
         )
-        mod_e_label = QLabel(f"Modern English Meaning: {mod_e_value}")
-        mod_e_label.setFont(QFont("Helvetica", 12, QFont.Weight.Bold))
-        self._format_field_label(mod_e_label, annotation.modern_english_meaning)
-        self.content_layout.addWidget(mod_e_label)
 
-        # Uncertainty
-        uncertain_value = "Yes" if annotation.uncertain else "?"
-        uncertain_label = QLabel(f"Uncertainty: {uncertain_value}")
-        self._format_field_label(uncertain_label, annotation.uncertain)
-        self.content_layout.addWidget(uncertain_label)
+    def _display_key(
+        self, token: Token, sentence: Sentence, values: dict[str, Any] | None
+    ) -> tuple[Any, ...]:
+        """
+        Identify everything :meth:`update_token` displays for a token.
 
-        # TODO: - Note: TODO field may not exist in model, check if needed
-        # For now, we'll skip it or show as "?"
+        Args:
+            token: Token to display
+            sentence: Sentence containing the token
+            values: The token's annotation fields from
+                :meth:`_annotation_values`, or ``None`` if it has no annotation
 
-        # Alternatives
-        alternatives_value = (
-            annotation.alternatives_json if annotation.alternatives_json else "?"
-        )
-        alternatives_label = QLabel(f"Alternatives: {alternatives_value}")
-        self._format_field_label(alternatives_label, annotation.alternatives_json)
-        self.content_layout.addWidget(alternatives_label)
+        Returns:
+            A tuple that changes whenever the displayed details would
 
-        # Confidence
-        confidence_value = (
-            f"{annotation.confidence}%" if annotation.confidence is not None else "?"
+        """
+        return (
+            token,
+            token.surface,
+            sentence,
+            sentence.display_order,
+            sentence.paragraph_number,
+            sentence.sentence_number_in_paragraph,
+            token.annotation,
+            values,
         )
-        confidence_label = QLabel(f"Confidence: {confidence_value}")
-        self._format_field_label(confidence_label, annotation.confidence)
-        self.content_layout.addWidget(confidence_label)
 
-    def _format_field_label(
+    def _add_field(
         self,
-        label: QLabel,
+        text: str,
         value: str | int | bool | None,  # noqa: FBT001
+        *,
+        bold: bool = False,
     ) -> None:
         """
-        Format a field label based on whether value is set.
+        Show a POS-specific field in the next unused field label.
 
         Args:
-            label: Label to format
+            text: Text to display
             value: Field value (None or empty means unset)
 
+        Keyword Args:
+            bold: Whether to display the field in bold
+
         """
-        if value is None or value == "" or value is False:
-            label.setStyleSheet("color: #999; font-style: italic;")
-        else:
-            label.setStyleSheet(
-                "color: #000; font-family: Helvetica; font-weight: normal;"
+        index = self._next_field
+        self._next_field += 1
+        label = self._field_labels[index]
+        self._set_label_text(label, text)
+        if self._field_bold[index] != bold:
+            self._field_bold[index] = bold
+            label.setFont(
+                _font("Helvetica", 12, QFont.Weight.Bold) if bold else self._field_font
             )
+        self._format_field_label(label, value)
+        label.setVisible(True)
 
-    def _display_noun_fields(self, annotation: Annotation) -> None:
+    def _emit_rows(
+        self,
+        values: dict[str, Any],
+        rows: tuple[tuple[str, str, str, bool], ...],
+    ) -> None:
         """
-        Display noun-specific fields.
+        Show POS-specific fields in the field labels.
 
         Args:
-            annotation: Annotation to display
-
-        """
-        # Gender
-        gender_value = self.GENDER_MAP.get(annotation.gender, "?")
-        gender_label = QLabel(f"Gender: {gender_value}")
-        self._format_field_label(gender_label, annotation.gender)
-        self.content_layout.addWidget(gender_label)
-
-        # Number
-        number_value = self.NUMBER_MAP.get(annotation.number, "?")
-        number_label = QLabel(f"Number: {number_value}")
-        self._format_field_label(number_label, annotation.number)
-        self.content_layout.addWidget(number_label)
-
-        # Case
-        case_value = self.CASE_MAP.get(annotation.case, "?")
-        case_label = QLabel(f"Case: {case_value}")
-        case_label.setFont(QFont("Helvetica", 12, QFont.Weight.Bold))
-        self._format_field_label(case_label, annotation.case)
-        self.content_layout.addWidget(case_label)
-
-        # Declension
-        declension_value = (
-            self.DECLENSION_MAP.get(annotation.declension, "?")
-            if annotation.declension is not None
-            else "?"
-        )
-        declension_label = QLabel(f"Declension: {declension_value}")
-        self._format_field_label(declension_label, annotation.declension)
-        self.content_layout.addWidget(declension_label)
+            values: Annotation fields from :meth:`_annotation_values`
+            rows: The rows of :attr:`POS_FIELD_ROWS` for the annotation's POS
 
-    def _display_verb_fields(self, annotation: Annotation) -> None:
         """
-        Display verb-specific fields.
+        add = self._add_field
+        field_text = self._field_text
+        for field_name, map_name, attr_name, bold in rows:
+            value = values[attr_name]
+            add(field_text(field_name, map_name, value), value, bold=bold)
+
+    @classmethod
+    @cache
+    def _field_text(cls, field_name: str, map_name: str, value: str | None) -> str:
+        """
+        Format the text of a POS-specific field.
 
-        Args:
-            annotation: Annotation to display
-
-        """
-        # Verb Class
-        verb_class_value = self.VERB_CLASS_MAP.get(annotation.verb_class, "?")
-        verb_class_label = QLabel(f"Verb Class: {verb_class_value}")
-        self._format_field_label(verb_class_label, annotation.verb_class)
-        self.content_layout.addWidget(verb_class_label)
-
-        # Verb Tense
-        tense_value = self.VERB_TENSE_MAP.get(annotation.verb_tense, "?")
-        tense_label = QLabel(f"Tense: {tense_value}")
-        self._format_field_label(tense_label, annotation.verb_tense)
-        self.content_layout.addWidget(tense_label)
-
-        # Verb Mood
-        mood_value = self.VERB_MOOD_MAP.get(annotation.verb_mood, "?")
-        mood_label = QLabel(f"Mood: {mood_value}")
-        self._format_field_label(mood_label, annotation.verb_mood)
-        self.content_layout.addWidget(mood_label)
-
-        # Verb Person
-        person_value = (
-            self.VERB_PERSON_MAP.get(annotation.verb_person, "?")
-            if annotation.verb_person is not None
-            else "?"
-        )
-        person_label = QLabel(f"Person: {person_value}")
-        self._format_field_label(person_label, annotation.verb_person)
-        self.content_layout.addWidget(person_label)
+        Each field only has a handful of values, so the text is formatted once
+        per value and shared by every token that has it.
 
-        # Number
-        number_value = self.NUMBER_MAP.get(annotation.number, "?")
-        number_label = QLabel(f"Number: {number_value}")
-        self._format_field_label(number_label, annotation.number)
-        self.content_layout.addWidget(number_label)
+        Args:
+            field_name: Name of the field, e.g. ``Gender``
+            map_name: Name of the lookup map for the field's values
+            value: The annotation's value for the field
 
-        # Verb Aspect
-        aspect_value = self.VERB_ASPECT_MAP.get(annotation.verb_aspect, "?")
-        aspect_label = QLabel(f"Aspect: {aspect_value}")
-        self._format_field_label(aspect_label, annotation.verb_aspect)
-        self.content_layout.addWidget(aspect_label)
+        Returns:
+            The field text, e.g. ``Gender: Masculine (m)``
 
-        # Verb Form
-        form_value = self.VERB_FORM_MAP.get(annotation.verb_form, "?")
-        form_label = QLabel(f"Form: {form_value}")
-        self._format_field_label(form_label, annotation.verb_form)
-        self.content_layout.addWidget(form_label)
+        """
+        # The lookup maps show an unset value as an empty string
+        text = "?" if value is None else getattr(cls, map_name).get(value, "?")
+        return f"{field_name}: {text}"
 
-    def _display_adjective_fields(self, annotation: Annotation) -> None:
+    def _display_common_fields(self, values: dict[str, Any]) -> None:
         """
-        Display adjective-specific fields.
+        Display fields common to all POS types.
 
         Args:
-            annotation: Annotation to display
+            values: Annotation fields from :meth:`_annotation_values`
 
         """
-        # Note: Degree and inflection may not be directly stored in annotation model
-        # For now, we'll show what's available
-
-        # Gender
-        gender_value = self.GENDER_MAP.get(annotation.gender, "?")
-        gender_label = QLabel(f"Gender: {gender_value}")
-        self._format_field_label(gender_label, annotation.gender)
-        self.content_layout.addWidget(gender_label)
+        set_text = self._set_label_text
+        format_label = self._format_field_label
+        root = values["root"]
+        meaning = values["modern_english_meaning"]
+        uncertain = values["uncertain"]
+        alternatives = values["alternatives_json"]
+        confidence = values["confidence"]
 
-        # Number
-        number_value = self.NUMBER_MAP.get(annotation.number, "?")
-        number_label = QLabel(f"Number: {number_value}")
-        self._format_field_label(number_label, annotation.number)
-        self.content_layout.addWidget(number_label)
-
-        # Case
-        case_value = self.CASE_MAP.get(annotation.case, "?")
-        case_label = QLabel(f"Case: {case_value}")
-        self._format_field_label(case_label, annotation.case)
-        self.content_layout.addWidget(case_label)
-
-    def _display_pronoun_fields(self, annotation: Annotation) -> None:
-        """
-        Display pronoun-specific fields.
+        # Root
+        set_text(self._root_label, f"Root: {root or '?'}")
+        format_label(self._root_label, root)
+        # Only offer the dictionary if root is not empty
+        self._root_value = root
+        self._dict_button.setVisible(bool(root))
 
-        Args:
-            annotation: Annotation to display
+        # Modern English Meaning
+        set_text(self._mod_e_label, f"Modern English Meaning: {meaning or '?'}")
+        format_label(self._mod_e_label, meaning)
 
-        """
-        # Pronoun Type
-        pro_type_value = self.PRONOUN_TYPE_MAP.get(annotation.pronoun_type, "?")
-        pro_type_label = QLabel(f"Pronoun Type: {pro_type_value}")
-        self._format_field_label(pro_type_label, annotation.pronoun_type)
-        self.content_layout.addWidget(pro_type_label)
+        # Uncertainty
+        uncertain_value = "Yes" if uncertain else "?"
+        set_text(self._uncertain_label, f"Uncertainty: {uncertain_value}")
+        format_label(self._uncertain_label, uncertain)
 
-        # Gender
-        gender_value = self.GENDER_MAP.get(annotation.gender, "?")
-        gender_label = QLabel(f"Gender: {gender_value}")
-        self._format_field_label(gender_label, annotation.gender)
-        self.content_layout.addWidget(gender_label)
+        # TODO: - Note: TODO field may not exist in model, check if needed
+        # For now, we'll skip it or show as "?"
 
-        # Number
-        number_value = self.PRONOUN_NUMBER_MAP.get(annotation.pronoun_number, "?")
-        number_label = QLabel(f"Number: {number_value}")
-        self._format_field_label(number_label, annotation.number)
-        self.content_layout.addWidget(number_label)
+        # Alternatives
+        set_text(self._alternatives_label, f"Alternatives: {alternatives or '?'}")
+        format_label(self._alternatives_label, alternatives)
 
-        # Case
-        case_value = self.CASE_MAP.get(annotation.case, "?")
-        case_label = QLabel(f"Case: {case_value}")
-        self._format_field_label(case_label, annotation.case)
-        self.content_layout.addWidget(case_label)
+        # Confidence
+        confidence_value = f"{confidence}%" if confidence is not None else "?"
+        set_text(self._confidence_label, f"Confidence: {confidence_value}")
+        format_label(self._confidence_label, confidence)
 
-    def _display_article_fields(self, annotation: Annotation) -> None:
+    def _set_label_text(self, label: QLabel, text: str) -> None:
         """
-        Display article/determiner-specific fields.
+        Set the text of a label, unless it already shows that text.
+
+        Setting a label's text marks it dirty and, for the rich-text header,
+        re-parses it, even if the text is unchanged.  Comparing against the
+        text we last set avoids reading the text back from Qt.
 
         Args:
-            annotation: Annotation to display
+            label: Label to update
+            text: Text to display
 
         """
-        # Article Type
-        article_type_value = self.ARTICLE_TYPE_MAP.get(annotation.article_type, "?")
-        article_type_label = QLabel(f"Article Type: {article_type_value}")
-        self._format_field_label(article_type_label, annotation.article_type)
-        self.content_layout.addWidget(article_type_label)
-
-        # Gender
-        gender_value = self.GENDER_MAP.get(annotation.gender, "?")
-        gender_label = QLabel(f"Gender: {gender_value}")
-        self._format_field_label(gender_label, annotation.gender)
-        self.content_layout.addWidget(gender_label)
-
-        # Number
-        number_value = self.NUMBER_MAP.get(annotation.number, "?")
-        number_label = QLabel(f"Number: {number_value}")
-        self._format_field_label(number_label, annotation.number)
-        self.content_layout.addWidget(number_label)
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
 
-        # Case
-        case_value = self.CASE_MAP.get(annotation.case, "?")
-        case_label = QLabel(f"Case: {case_value}")
-        self._format_field_label(case_label, annotation.case)
-        self.content_layout.addWidget(case_label)
-
-    def _display_preposition_fields(self, annotation: Annotation) -> None:
+    def _format_field_label(
+        self,
+        label: QLabel,
+        value: str | int | bool | None,  # noqa: FBT001
+    ) -> None:
         """
-        Display preposition-specific fields.
+        Format a field label based on whether value is set.
 
         Args:
-            annotation: Annotation to display
+            label: Label to format
+            value: Field value (None or empty means unset)
 
         """
-        # Preposition Case
-        prep_case_value = self.PREPOSITION_CASE_MAP.get(annotation.prep_case, "?")
-        prep_case_label = QLabel(f"Governed Case: {prep_case_value}")
-        self._format_field_label(prep_case_label, annotation.prep_case)
-        self.content_layout.addWidget(prep_case_label)
-
-    def _display_adverb_fields(self, annotation: Annotation) -> None:
-        """Display adverb-specific fields."""
-        # Adverbs have minimal fields
-
-    def _display_conjunction_fields(self, annotation: Annotation) -> None:
-        """Display conjunction-specific fields."""
-        # Conjunctions have minimal fields
-
-    def _display_interjection_fields(self, annotation: Annotation) -> None:
-        """Display interjection-specific fields."""
-        # Interjections have minimal fields
+        if value is None or value == "" or value is False:
+            style = self.UNSET_FIELD_STYLE
+        else:
+            style = self.SET_FIELD_STYLE
+        # Setting a style sheet re-polishes the label, even if it is unchanged.
+        # Compare against the constant we last applied, rather than converting
+        # the label's style sheet back to a Python string
+        if self._label_styles.get(label) is not style:
+            label.setStyleSheet(style)
+            self._label_styles[label] = style
 
     def clear(self) -> None:
         """Clear the sidebar and show empty state."""
+        self._update_timer.stop()
+        self._pending_update = None
         self._current_token = None
         self._current_sentence = None
+        self._displayed_key = None
         self._show_empty_state()
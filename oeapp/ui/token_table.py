@@ -1,8 +1,10 @@
 """Token table UI component."""
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar, Final
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import (
     QKeyEvent,
     QKeySequence,
@@ -21,8 +23,13 @@ from PySide6.QtWidgets import (
 from oeapp.models.token import Token
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from oeapp.models.annotation import Annotation
 
+#: Text shown in an annotation cell whose value is not set.
+_DASH: Final[str] = "—"
+
 
 class AnnotationTableWidget(QTableWidget):
     """
@@ -98,12 +105,57 @@ class TokenTable(QWidget):
     #: key is pressed on the table widget).
     annotation_requested = Signal(Token)
 
+    #: The annotation attribute shown in each column after the "Word" column.
+    ANNOTATION_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "pos",
+        "modern_english_meaning",
+        "root",
+        "gender",
+        "number",
+        "case",
+        "declension",
+        "pronoun_type",
+        "verb_class",
+        "verb_form",
+        "prep_case",
+    )
+
+    #: Getter returning an annotation's values for :attr:`ANNOTATION_COLUMNS`
+    #: as a tuple.
+    _annotation_getter: ClassVar[attrgetter] = attrgetter(*ANNOTATION_COLUMNS)
+    #: The annotation column texts for a token without an annotation.
+    _UNANNOTATED_TEXTS: ClassVar[tuple[str, ...]] = (_DASH,) * len(ANNOTATION_COLUMNS)
+
+    #: Vertical padding in pixels added to the font height for each row.
+    ROW_PADDING: ClassVar[int] = 6
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         #: The tokens to display.
         self.tokens: list[Token] = []
         #: The annotations to display.
         self.annotations: dict[int, Annotation] = {}  # token_id -> Annotation
+        # Row of each displayed token, by token ID
+        self._row_by_token_id: dict[int, int] = {}
+        # Item cloned for every unset annotation cell
+        self._dash_item = QTableWidgetItem(_DASH)
+        # Whether the table has been hidden with :meth:`setVisible`
+        self._hidden: bool = False
+        # Whether :meth:`set_tokens` was called while hidden, so the table
+        # still has to be populated when it is shown
+        self._population_deferred: bool = False
+        # Annotations passed to :meth:`update_annotation` that have not been
+        # written to the table yet, by token ID
+        self._pending_annotations: dict[int, Annotation] = {}
+        # Timer that writes :attr:`_pending_annotations` once control returns
+        # to the event loop, so back-to-back updates share one repaint
+        self._annotation_timer = QTimer(self)
+        self._annotation_timer.setSingleShot(True)
+        self._annotation_timer.setInterval(0)
+        self._annotation_timer.timeout.connect(self.flush_pending_annotations)
+        # The token in the current row, kept up to date as the selection
+        # changes so :meth:`get_selected_token` does not have to ask the table
+        self._selected_token: Token | None = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -127,8 +179,8 @@ class TokenTable(QWidget):
         self.table.set_token_table_ref(self)
         # Connect the annotation key signal
         self.table.annotation_key_pressed.connect(self._on_annotation_key_pressed)
-        # Set the number of columns to 12.
-        self.table.setColumnCount(12)
+        # The "Word" column, then one column per annotation attribute.
+        self.table.setColumnCount(1 + len(self.ANNOTATION_COLUMNS))
         # Set the horizontal header labels.
         self.table.setHorizontalHeaderLabels(
             [
@@ -149,6 +201,13 @@ class TokenTable(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        # Every row holds a single line of text, so give rows a fixed height
+        # rather than having Qt measure each row's contents
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(
+            self.table.fontMetrics().height() + self.ROW_PADDING
+        )
         self.table.setAlternatingRowColors(True)
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
@@ -198,6 +257,10 @@ class TokenTable(QWidget):
             visible: Whether to show the token table
 
         """
+        self._hidden = not visible
+        if visible:
+            # Populate before showing, so the table is painted once, filled
+            self._ensure_populated()
         super().setVisible(visible)
         self.table.setVisible(visible)
         if visible:
@@ -230,11 +293,14 @@ class TokenTable(QWidget):
           token_selected signal.
 
         """
-        # Get the current row of the table.
-        row = self.current_row
-        if 0 <= row < len(self.tokens):
-            token = self.tokens[row]
-            self.token_selected.emit(token)
+        self._sync_selected_token()
+        if self._selected_token is not None:
+            self.token_selected.emit(self._selected_token)
+
+    def _sync_selected_token(self) -> None:
+        """Set :attr:`_selected_token` to the token in the table's current row."""
+        row = self.table.currentRow()
+        self._selected_token = self.tokens[row] if 0 <= row < len(self.tokens) else None
 
     def _on_annotation_key_pressed(self) -> None:
         """
@@ -246,6 +312,100 @@ class TokenTable(QWidget):
         if token:
             self.annotation_requested.emit(token)
 
+    def _item(self, text: str) -> QTableWidgetItem:
+        """
+        Create the table item for a cell.
+
+        Dashes for unset values are cloned from a single prototype item rather
+        than constructed from the string each time.
+
+        Args:
+            text: Text of the cell
+
+        Returns:
+            A new table item
+
+        """
+        if text is _DASH:
+            return self._dash_item.clone()
+        return QTableWidgetItem(text)
+
+    def _set_cell(self, row: int, col: int, text: str) -> None:
+        """
+        Show text in a cell, reusing the cell's item if it already has one.
+
+        Changing the text of an existing item avoids allocating a new item, and
+        is skipped entirely if the text is unchanged.
+
+        Args:
+            row: Row of the cell
+            col: Column of the cell
+            text: Text to show
+
+        """
+        table = self.table
+        item = table.item(row, col)
+        if item is None:
+            table.setItem(row, col, self._item(text))
+        elif item.text() != text:
+            item.setText(text)
+
+    @classmethod
+    def _annotation_texts(cls, annotation: Annotation | None) -> tuple[str, ...]:
+        """
+        Compute the text of each annotation column for an annotation.
+
+        All the values are fetched with a single getter call, and every unset
+        value is the same :data:`_DASH` string object.
+
+        Args:
+            annotation: Annotation to show, or ``None``
+
+        Returns:
+            The text for each column in :attr:`ANNOTATION_COLUMNS`
+
+        """
+        if annotation is None:
+            return cls._UNANNOTATED_TEXTS
+        return tuple(value or _DASH for value in cls._annotation_getter(annotation))
+
+    def _set_annotation_cells(self, row: int, annotation: Annotation | None) -> None:
+        """
+        Show an annotation in the annotation columns of a row.
+
+        Args:
+            row: Row to update
+            annotation: Annotation to show, or ``None`` to show "—" throughout
+
+        """
+        set_cell = self._set_cell
+        for col, text in enumerate(self._annotation_texts(annotation), start=1):
+            set_cell(row, col, text)
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """
+        Suspend repaints and signals of :attr:`table` while many cells change.
+
+        Without this, every cell change schedules its own repaint, and rows
+        removed from under the selection emit selection signals part-way
+        through.  On exit the table is repainted once for everything changed
+        inside the block.
+
+        Yields:
+            Nothing
+
+        """
+        table = self.table
+        updates_enabled = table.updatesEnabled()
+        table.setUpdatesEnabled(False)
+        signals_blocked = table.blockSignals(True)  # noqa: FBT003
+        try:
+            yield
+        finally:
+            table.blockSignals(signals_blocked)
+            table.setUpdatesEnabled(updates_enabled)
+
     def set_tokens(self, tokens: list[Token]) -> None:
         """
         Set tokens and annotations to display.
@@ -260,104 +420,126 @@ class TokenTable(QWidget):
         """
         # Set the tokens to display.
         self.tokens = tokens
-        # Set the number of rows to the number of tokens.
-        self.table.setRowCount(len(tokens))
-        # Loop through the tokens and add them to the table.
-
-        for row, token in enumerate(tokens):
-            # Word
-            self.table.setItem(row, 0, QTableWidgetItem(token.surface))
-            # Get annotation for this token
-            annotation = token.annotation
-            if annotation:
-                # POS
-                self.table.setItem(row, 1, QTableWidgetItem(annotation.pos or "—"))
-                # ModE
-                self.table.setItem(
-                    row, 2, QTableWidgetItem(annotation.modern_english_meaning or "—")
-                )
-                # Root
-                self.table.setItem(row, 3, QTableWidgetItem(annotation.root or "—"))
-                # Gender
-                self.table.setItem(row, 4, QTableWidgetItem(annotation.gender or "—"))
-                # Number
-                self.table.setItem(row, 5, QTableWidgetItem(annotation.number or "—"))
-                # Case
-                self.table.setItem(row, 6, QTableWidgetItem(annotation.case or "—"))
-                # Declension
-                self.table.setItem(
-                    row, 7, QTableWidgetItem(annotation.declension or "—")
-                )
-                # PronounType
-                self.table.setItem(
-                    row, 8, QTableWidgetItem(annotation.pronoun_type or "—")
-                )
-                # VerbClass
-                self.table.setItem(
-                    row, 9, QTableWidgetItem(annotation.verb_class or "—")
-                )
-                # VerbForm
-                self.table.setItem(
-                    row, 10, QTableWidgetItem(annotation.verb_form or "—")
-                )
-                # PrepObjCase
-                self.table.setItem(
-                    row, 11, QTableWidgetItem(annotation.prep_case or "—")
-                )
-            else:
-                # Fill with "—" for unannotated tokens
-                for col in range(1, 12):
-                    self.table.setItem(row, col, QTableWidgetItem("—"))
+        self._selected_token = None
+        self._row_by_token_id = {token.id: row for row, token in enumerate(tokens)}
+        if self._hidden:
+            # Nobody can see the rows yet; populate them when shown
+            self._population_deferred = True
+            return
+        self._population_deferred = False
+        self._populate()
+
+    def _ensure_populated(self) -> None:
+        """Populate the table if :meth:`set_tokens` was deferred while hidden."""
+        if self._population_deferred:
+            self._population_deferred = False
+            self._populate()
+
+    def _populate(self) -> None:
+        """Fill the table with a row for each token in :attr:`tokens`."""
+        tokens = self.tokens
+        header = self.table.horizontalHeader()
+        # Stretched sections are laid out again as rows are added, so stretch
+        # them once, after all the rows are filled
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        try:
+            with self._batch_updates():
+                # Set the number of rows to the number of tokens.  Rows that
+                # are already there keep their items, which are updated in
+                # place.
+                self._remove_rows_from(len(tokens))
+                self.table.setRowCount(len(tokens))
+                # Bound once here rather than looked up for every row
+                set_cell = self._set_cell
+                set_annotation_cells = self._set_annotation_cells
+                # Loop through the tokens and add them to the table.
+                for row, token in enumerate(tokens):
+                    # Word
+                    set_cell(row, 0, token.surface)
+                    # Annotation columns, with "—" for unannotated tokens
+                    set_annotation_cells(row, token.annotation)
+        finally:
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Selection signals were blocked, so pick up the current row's new token
+        self._sync_selected_token()
+
+    def _remove_rows_from(self, row_count: int) -> None:
+        """
+        Take the items out of the rows at and after ``row_count``.
+
+        The items were created from Python, so they have Python wrappers.
+        Taking them out lets the wrappers delete them.  If the rows were
+        simply dropped with ``setRowCount``, Qt would delete the items behind
+        the wrappers' backs, and a wrapper could then be handed out for an
+        unrelated object later allocated at the same address.
+
+        Args:
+            row_count: Number of rows to keep
+
+        """
+        table = self.table
+        for row in range(row_count, table.rowCount()):
+            for col in range(table.columnCount()):
+                table.takeItem(row, col)
 
     def update_annotation(self, annotation: Annotation) -> None:
         """
         Update annotation display for a token.
 
+        The table cells are updated once control returns to the event loop,
+        together with any other annotations updated before then.
+
         Args:
             annotation: Updated annotation
 
         """
         # Update the annotation in the annotations dictionary.
         self.annotations[annotation.token_id] = annotation
-        # Find token row
-        for row, token in enumerate(self.tokens):
-            if token.id == annotation.token_id:
-                # Update row
-                # POS
-                self.table.setItem(row, 1, QTableWidgetItem(annotation.pos or "—"))
-                # ModE
-                self.table.setItem(
-                    row, 2, QTableWidgetItem(annotation.modern_english_meaning or "—")
-                )
-                # Root
-                self.table.setItem(row, 3, QTableWidgetItem(annotation.root or "—"))
-                # Gender
-                self.table.setItem(row, 4, QTableWidgetItem(annotation.gender or "—"))
-                # Number
-                self.table.setItem(row, 5, QTableWidgetItem(annotation.number or "—"))
-                # Case
-                self.table.setItem(row, 6, QTableWidgetItem(annotation.case or "—"))
-                # Declension
-                self.table.setItem(
-                    row, 7, QTableWidgetItem(annotation.declension or "—")
-                )
-                # PronounType
-                self.table.setItem(
-                    row, 8, QTableWidgetItem(annotation.pronoun_type or "—")
-                )
-                # VerbClass
-                self.table.setItem(
-                    row, 9, QTableWidgetItem(annotation.verb_class or "—")
-                )
-                # VerbForm
-                self.table.setItem(
-                    row, 10, QTableWidgetItem(annotation.verb_form or "—")
-                )
-                # PrepObjCase
-                self.table.setItem(
-                    row, 11, QTableWidgetItem(annotation.prep_case or "—")
-                )
-                break
+        self._pending_annotations[annotation.token_id] = annotation
+        if not self._annotation_timer.isActive():
+            self._annotation_timer.start()
+
+    def flush_pending_annotations(self) -> None:
+        """Immediately show the annotations still waiting to be written."""
+        self._annotation_timer.stop()
+        pending = self._pending_annotations
+        if not pending:
+            return
+        self._pending_annotations = {}
+        if self._population_deferred:
+            # The annotations will be shown when the table is populated
+            return
+        row_by_token_id = self._row_by_token_id
+        set_annotation_cells = self._set_annotation_cells
+        with self._batch_updates():
+            for token_id, annotation in pending.items():
+                # Find token row
+                row = row_by_token_id.get(token_id)
+                if row is None:
+                    continue
+                # Update the row's items in place
+                set_annotation_cells(row, annotation)
+
+    def refresh_annotations(self, tokens: list[Token]) -> None:
+        """
+        Refresh the annotation columns for the tokens already displayed.
+
+        Unlike :meth:`set_tokens`, this leaves the "Word" column and the rows
+        alone.  ``tokens`` must be the same tokens, in the same order, as the
+        ones displayed.
+
+        Args:
+            tokens: List of tokens
+
+        """
+        self.tokens = tokens
+        if self._population_deferred:
+            # The annotations will be shown when the table is populated
+            return
+        set_annotation_cells = self._set_annotation_cells
+        with self._batch_updates():
+            for row, token in enumerate(tokens):
+                set_annotation_cells(row, token.annotation)
 
     def get_selected_token(self) -> Token | None:
         """
@@ -370,10 +552,7 @@ class TokenTable(QWidget):
             Selected :class:`~oeapp.models.token.Token` object or ``None``
 
         """
-        row = self.current_row
-        if 0 <= row < len(self.tokens):
-            return self.tokens[row]
-        return None
+        return self._selected_token
 
     def select_token(self, token_index: int) -> None:
         """
@@ -387,6 +566,7 @@ class TokenTable(QWidget):
         """
         # If the token index is valid, select the row.
         if 0 <= token_index < len(self.tokens):
+            self._ensure_populated()
             self.table.selectRow(token_index)
             # Ensure the selected row is scrolled into view
             item = self.table.item(token_index, 0)
@@ -405,16 +585,14 @@ class TokenTable(QWidget):
 
     def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
         """
-        Handle show event to refresh table when widget becomes visible.
+        Handle show event to populate the table if it changed while hidden.
+
+        A table whose rows are up to date is not touched, so showing and
+        hiding it repeatedly costs nothing.
 
         Args:
             event: Show event
 
         """
         super().showEvent(event)
-        # Always refresh table when shown if we have stored tokens
-        # This handles cases where Qt clears the table when hidden
-        # Check if table is empty or if we have tokens to refresh
-        if self.tokens and (self.table.rowCount() == 0 or not self.table.item(0, 0)):
-            # Table is empty or first item is missing - refresh it
-            self.refresh()
+        self._ensure_populated()
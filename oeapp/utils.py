@@ -2,16 +2,39 @@
 
 import sys
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 
 
+def _base_path() -> Path:
+    """
+    Get the directory resources are looked up in.
+
+    Returns:
+        The PyInstaller bundle directory, or the project root in development
+
+    """
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        # Running in PyInstaller bundle
+        return Path(sys._MEIPASS)
+    # Running in development
+    return Path(__file__).parent.parent
+
+
+#: The directory resources are looked up in; see :func:`_base_path`
+_BASE_PATH: Path = _base_path()
+
+
+@cache
 def get_resource_path(relative_path: str) -> Path:
     """
     Get resource path for bundled application or development.
 
+    Results are cached, since the same resources are looked up repeatedly.
+
     Args:
         relative_path: Relative path from project root
 
@@ -19,13 +42,7 @@ def get_resource_path(relative_path: str) -> Path:
         Path to resource file
 
     """
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        # Running in PyInstaller bundle
-        base_path = Path(sys._MEIPASS)
-    else:
-        # Running in development
-        base_path = Path(__file__).parent.parent
-    return base_path / relative_path
+    return _BASE_PATH / relative_path
 
 
 def to_utc_iso(dt: datetime | None) -> str | None:
@@ -41,12 +58,14 @@ def to_utc_iso(dt: datetime | None) -> str | None:
     """
     if dt is None:
         return None
+    tz = dt.tzinfo
     # If datetime is naive, assume it's already UTC (database stores UTC)
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
-    # Convert to UTC if not already
-    dt_utc = dt.astimezone(UTC)
-    return dt_utc.isoformat()
+    if tz is None:
+        return dt.replace(tzinfo=UTC).isoformat()
+    # Only convert if not already in UTC
+    if tz is UTC:
+        return dt.isoformat()
+    return dt.astimezone(UTC).isoformat()
 
 
 def from_utc_iso(iso_str: str | None) -> datetime | None:
@@ -62,9 +81,17 @@ def from_utc_iso(iso_str: str | None) -> datetime | None:
     """
     if iso_str is None:
         return None
+    # Timestamps written by to_utc_iso() are already UTC, so drop the offset
+    # and parse them straight into a naive datetime
+    if iso_str.endswith("+00:00"):
+        return datetime.fromisoformat(iso_str[:-6])
+    if iso_str.endswith("Z"):
+        return datetime.fromisoformat(iso_str[:-1])
     dt = datetime.fromisoformat(iso_str)
-    # Ensure it's in UTC
-    dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+    tz = dt.tzinfo
+    # Ensure it's in UTC, converting only if it is in some other timezone
+    if tz is not None and tz is not UTC:
+        dt = dt.astimezone(UTC)
     # Return naive datetime (SQLite doesn't handle timezone-aware datetimes well)
     return dt.replace(tzinfo=None)
 
@@ -169,6 +169,31 @@ class TestAnnotation:
         assert data["uncertain"] is True
         assert "updated_at" in data
 
+    def test_state_snapshot_captures_editable_fields(self, db_session):
+        """Test state_snapshot() returns the user-editable fields."""
+        project = create_test_project(db_session)
+        sentence = create_test_sentence(db_session, project.id, "Se cyning")
+        token = Token.list(db_session, sentence.id)[1]
+
+        annotation = Annotation.get(db_session, token.id)
+        assert annotation is not None
+        annotation.pos = "N"
+        annotation.case = "n"
+        annotation.root = "cyning"
+        db_session.commit()
+
+        state = annotation.state_snapshot()
+        assert tuple(state) == Annotation.STATE_FIELDS
+        assert state["pos"] == "N"
+        assert state["case"] == "n"
+        assert state["root"] == "cyning"
+        assert state["gender"] is None
+        assert "updated_at" not in state
+
+        # The snapshot is a copy, not a live view
+        annotation.pos = "V"
+        assert state["pos"] == "N"
+
     def test_from_json_creates_annotation(self, db_session):
         """Test from_json() creates annotation from data."""
         project = create_test_project(db_session)
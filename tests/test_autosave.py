@@ -19,7 +19,7 @@ class TestAutosaveService:
 
         assert service.save_callback == callback
         assert service.debounce_ms == 1000
-        assert service._timer is None
+        assert not service._timer.isActive()
         assert service._pending is False
 
     def test_init_default_debounce(self):
@@ -52,8 +52,8 @@ class TestAutosaveService:
         # Just check that timer exists and is configured correctly
         assert service._timer.interval() == 100
 
-    def test_trigger_cancels_existing_timer(self):
-        """Test trigger() cancels existing timer."""
+    def test_trigger_reuses_timer(self):
+        """Test trigger() restarts the same timer rather than creating one."""
         callback = MagicMock()
         service = AutosaveService(callback, debounce_ms=100)
 
@@ -63,10 +63,8 @@ class TestAutosaveService:
         service.trigger()
         second_timer = service._timer
 
-        # Should have different timer instances
-        assert first_timer != second_timer
-        # First timer should be stopped
-        assert not first_timer.isActive()
+        assert first_timer is second_timer
+        assert second_timer.isActive()
 
     def test_trigger_calls_save_after_debounce(self, qapp):
         """Test trigger() calls save_callback after debounce period."""
@@ -120,8 +118,8 @@ class TestAutosaveService:
 
         service.save_now()
 
-        # Timer should be stopped and deleted
-        assert service._timer is None
+        # Timer should be stopped
+        assert not service._timer.isActive()
 
     def test_save_now_clears_pending(self):
         """Test save_now() clears _pending flag."""
@@ -136,7 +134,7 @@ class TestAutosaveService:
         assert service._pending is False
 
     def test_cancel_stops_timer(self):
-        """Test cancel() stops and deletes timer."""
+        """Test cancel() stops timer."""
         callback = MagicMock()
         service = AutosaveService(callback, debounce_ms=1000)
 
@@ -146,7 +144,7 @@ class TestAutosaveService:
 
         service.cancel()
 
-        assert service._timer is None
+        assert not service._timer.isActive()
         assert service._pending is False
 
     def test_cancel_clears_pending(self):
@@ -65,6 +65,24 @@ class TestTokenOccurrenceMixin:
             result = mixin._find_token_occurrence(text, token, tokens)
             assert result is None
 
+    def test_find_token_occurrence_with_surface_ranks(self, db_session):
+        """Test precomputed surface ranks locate repeated surfaces."""
+        mixin = TokenOccurrenceMixin()
+        text = "Se cyning and se cyning"
+        project = create_test_project(db_session)
+        sentence = create_test_sentence(db_session, project.id, text)
+        tokens = Token.list(db_session, sentence.id)
+        ranks = mixin._surface_ranks(tokens)
+        assert [ranks[id(t)] for t in tokens] == [0, 0, 0, 0, 1]
+        results = [
+            mixin._find_token_occurrence(text, t, tokens, surface_ranks=ranks)
+            for t in tokens
+        ]
+        assert results == [
+            mixin._find_token_occurrence(text, t, tokens) for t in tokens
+        ]
+        assert results == [0, 3, 10, 14, 17]
+
     def test_find_token_occurrence_empty_surface(self, db_session):
         """Test handles empty surface."""
         mixin = TokenOccurrenceMixin()
@@ -1,9 +1,16 @@
 """Unit tests for SentenceCard."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from oeapp.ui.sentence_card import SentenceCard, ClickableTextEdit
+from PySide6.QtGui import QColor
+
+from oeapp.ui.sentence_card import (
+    SentenceCard,
+    ClickableTextEdit,
+    _SELECTION_COLOR,
+    _background_format,
+)
 from tests.conftest import create_test_project, create_test_sentence
 
 
@@ -114,6 +121,620 @@ class TestSentenceCard:
 
         assert card.sentence.is_paragraph_start is True
 
+    def test_token_table_built_on_first_use(self, db_session, qapp):
+        """Test the hidden token table is only built when first accessed."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        assert card._token_table is None
+        assert not card.has_focus
+
+        card._toggle_token_table()
+
+        assert card._token_table is not None
+        assert card.token_table.table.rowCount() == 2
+        assert card.token_table_toggle_button.text() == "Hide Token Table"
+
+    def test_oe_plain_text_cache_tracks_text_changes(self, db_session, qapp):
+        """Test the cached OE plain text follows changes to the editor."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        assert card._oe_plain_text == "Se cyning"
+
+        card.oe_text_edit.setPlainText("Se cyning fēoll")
+
+        # The document is only serialized again when the text is read
+        assert card._cached_oe_text is None
+        assert card._oe_plain_text == "Se cyning fēoll"
+        assert card._cached_oe_text == "Se cyning fēoll"
+
+        # The cache is still refreshed while editing, when the edit handler
+        # itself is disconnected
+        card._on_edit_oe_clicked()
+        card.oe_text_edit.setPlainText("Se cyning fēoll hēr")
+
+        assert card._oe_plain_text == "Se cyning fēoll hēr"
+
+    def test_update_sentence_does_not_trigger_edit_handlers(self, db_session, qapp):
+        """Test syncing the card from the model is not treated as an edit."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        sentence.text_modern = "The king"
+        db_session.commit()
+
+        card.update_sentence(sentence)
+
+        assert card.get_translation() == "The king"
+        assert not card._translation_debounce.isActive()
+        assert not card._oe_text_debounce.isActive()
+        assert card._oe_plain_text == "Se cyning"
+
+    def test_find_token_at_position_repeated_surfaces(self, db_session, qapp):
+        """Test _find_token_at_position maps repeated surfaces to the right token."""
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning and se cyning"
+        )
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        text = "Se cyning and se cyning"
+
+        assert card._find_token_at_position(text, 0) == 0
+        assert card._find_token_at_position(text, 5) == 1
+        assert card._find_token_at_position(text, 10) == 2
+        assert card._find_token_at_position(text, 14) == 3
+        assert card._find_token_at_position(text, 20) == 4
+        # Whitespace between tokens resolves to the nearest token
+        assert card._find_token_at_position(text, 9) == 1
+
+    def test_find_nearest_token(self, db_session, qapp):
+        """Test _find_nearest_token picks the closest neighbouring span."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        card = SentenceCard(project.sentences[0], session=db_session, parent=None)
+        spans = card._get_token_spans("  Se    cyning   ")
+        assert spans == [(2, 4, 0), (8, 14, 1)]
+
+        assert card._find_nearest_token(spans, 0) == 0
+        assert card._find_nearest_token(spans, 3) == 0
+        assert card._find_nearest_token(spans, 5) == 0
+        assert card._find_nearest_token(spans, 7) == 1
+        assert card._find_nearest_token(spans, 15) == 1
+        assert card._find_nearest_token(spans, 40) == 1
+
+        card.tokens = []
+        spans = card._get_token_spans("Se cyning")
+        assert card._find_nearest_token(spans, 3) is None
+
+    def test_highlight_token_in_text_repeated_surface(self, db_session, qapp):
+        """Test selecting a repeated surface highlights that token's occurrence."""
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning and se cyning"
+        )
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning and se cyning")
+
+        card._highlight_token_in_text(sentence.tokens[4])
+
+        assert card._current_highlight_start == 17
+        assert card._current_highlight_length == 6
+        selection = card.oe_text_edit.extraSelections()[-1]
+        assert selection.cursor.selectedText() == "cyning"
+        assert selection.cursor.selectionStart() == 17
+
+    def test_highlight_token_range(self, db_session, qapp):
+        """Test a token range is highlighted from its first to last token."""
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning and se cyning"
+        )
+        db_session.commit()
+
+        card = SentenceCard(project.sentences[0], session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning and se cyning")
+
+        card._highlight_token_range(3, 4)
+
+        assert card._current_highlight_start == 14
+        assert card._current_highlight_length == 9
+        selections = card.oe_text_edit.extraSelections()
+        assert [sel.cursor.selectedText() for sel in selections] == ["se", "cyning"]
+        assert all(
+            sel.format.background().color() == _SELECTION_COLOR for sel in selections
+        )
+
+    def test_background_format_is_shared_per_color(self, qapp):
+        """Test highlight formats are built once per background color."""
+        first = _background_format(QColor(10, 20, 30))
+        assert _background_format(QColor(10, 20, 30)) is first
+        assert first.background().color() == QColor(10, 20, 30)
+        assert _background_format(QColor(30, 20, 10)) is not first
+
+    def test_set_tokens_with_same_tokens_refreshes_annotations(
+        self, db_session, qapp
+    ):
+        """Test set_tokens only refreshes annotations if the tokens are unchanged."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        table = card.token_table
+        table.setVisible(True)
+        table.set_tokens = MagicMock(wraps=table.set_tokens)
+        sentence.tokens[1].annotation.pos = "N"
+
+        card.set_tokens(sentence.tokens)
+
+        table.set_tokens.assert_not_called()
+        assert table.table.item(1, 1).text() == "N"
+
+        card.set_tokens(sentence.tokens[1:])
+
+        table.set_tokens.assert_called_once()
+
+    def test_superscripts_follow_repeated_surface(self, db_session, qapp):
+        """Test a note superscript is placed after the token it ends."""
+        from oeapp.models.note import Note
+
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning and se cyning"
+        )
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        end_token = sentence.tokens[4]
+        db_session.add(
+            Note(
+                sentence_id=sentence.id,
+                start_token=end_token.id,
+                end_token=end_token.id,
+                note_text_md="The second king",
+                note_type="token",
+            )
+        )
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card._render_oe_text_with_superscripts()
+
+        assert card.get_oe_text() == "Se cyning and se cyning1"
+
+    def test_token_spans_rebuilt_after_set_tokens(self, db_session, qapp):
+        """Test the cached token spans are invalidated by set_tokens."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+
+        assert card._get_token_spans("Se cyning") == [(0, 2, 0), (3, 9, 1)]
+        card.set_tokens(sentence.tokens[1:])
+        assert card._get_token_spans("Se cyning") == [(3, 9, 0)]
+
+    def test_token_spans_skip_surface_inside_earlier_token(self, db_session, qapp):
+        """Test a surface embedded in an earlier token is not matched there."""
+        project = create_test_project(db_session, name="Test", text="hūse se")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+
+        # "se" also occurs inside "hūse"; it must resolve to the standalone word
+        assert card._get_token_spans("hūse se") == [(0, 4, 0), (5, 7, 1)]
+        assert card._find_token_range(1, "hūse se") == (5, 7)
+
+    def test_pos_highlighting_skips_default_and_unselected(self, db_session, qapp):
+        """Test POS highlighting only highlights selected, non-default POS tags."""
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning fēoll"
+        )
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        tokens = sentence.tokens
+        tokens[0].annotation.pos = "D"
+        tokens[1].annotation.pos = "N"
+        tokens[2].annotation.pos = None
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning fēoll")
+        card._selected_pos = {"N"}
+        card._apply_pos_highlighting()
+
+        selections = card.oe_text_edit.extraSelections()
+        assert len(selections) == 1
+        assert selections[0].cursor.selectionStart() == 3
+        assert selections[0].cursor.selectionEnd() == 9
+        assert selections[0].format.background().color() == card.POS_COLORS["N"]
+
+    def test_clear_highlight_keeps_mode_selections(self, db_session, qapp):
+        """Test clearing the selection highlight restores the mode highlights."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        sentence.tokens[1].annotation.pos = "N"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning")
+        card._apply_pos_highlighting()
+
+        card._highlight_token_in_text(sentence.tokens[1])
+        assert len(card.oe_text_edit.extraSelections()) == 2
+
+        card._clear_highlight()
+        selections = card.oe_text_edit.extraSelections()
+        assert len(selections) == 1
+        assert selections[0].format.background().color() == card.POS_COLORS["N"]
+
+    def test_highlight_token_replaces_previous_in_one_update(self, db_session, qapp):
+        """Test moving the selection highlight sets the selections only once."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning")
+        card._highlight_token_in_text(sentence.tokens[0])
+
+        with patch.object(
+            card.oe_text_edit,
+            "setExtraSelections",
+            wraps=card.oe_text_edit.setExtraSelections,
+        ) as set_selections:
+            card._highlight_token_in_text(sentence.tokens[1])
+
+        set_selections.assert_called_once()
+        selections = card.oe_text_edit.extraSelections()
+        assert [sel.cursor.selectedText() for sel in selections] == ["cyning"]
+
+    def test_unchanged_highlighting_mode_is_not_rebuilt(self, db_session, qapp):
+        """Test reapplying an unchanged mode reuses its selections."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        token.annotation.pos = "N"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning")
+        card._apply_pos_highlighting()
+        selections = card._mode_selections
+
+        card._apply_pos_highlighting()
+        assert card._mode_selections is selections
+
+        token.annotation.pos = "V"
+        card._on_annotation_applied(token.annotation)
+        card._apply_pos_highlighting()
+        assert card._mode_selections is not selections
+
+    def test_highlighting_rebuilt_after_update_sentence(self, db_session, qapp):
+        """Test update_sentence with the same text does not collapse highlights."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        sentence.tokens[1].annotation.pos = "N"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card._apply_pos_highlighting()
+        assert card._mode_selections
+
+        card.update_sentence(sentence)
+        card._apply_pos_highlighting()
+
+        selections = card.oe_text_edit.extraSelections()
+        assert selections
+        assert all(selection.cursor.hasSelection() for selection in selections)
+
+    def test_highlighting_merges_adjacent_same_color_tokens(self, db_session, qapp):
+        """Test adjacent tokens with the same color share one selection."""
+        project = create_test_project(
+            db_session, name="Test", text="Se cyning fēoll"
+        )
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        for token in sentence.tokens:
+            token.annotation.number = "s"
+        sentence.tokens[0].annotation.pos = "D"
+        sentence.tokens[1].annotation.pos = "N"
+        sentence.tokens[2].annotation.pos = "V"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card.oe_text_edit.setPlainText("Se cyning fēoll")
+        card._apply_number_highlighting()
+
+        selections = card.oe_text_edit.extraSelections()
+        assert len(selections) == 1
+        assert selections[0].cursor.selectionStart() == 0
+        assert selections[0].cursor.selectionEnd() == 15
+
+    def test_highlight_entries_shared_per_code_combination(self, qapp):
+        """Test tokens with the same codes share their highlight entries."""
+        entries = SentenceCard._highlight_entries("N", "g", "p")
+
+        assert SentenceCard._highlight_entries("N", "g", "p") is entries
+        assert entries == (
+            ("N", SentenceCard.POS_COLORS["N"]),
+            ("g", SentenceCard.CASE_COLORS["g"]),
+            ("p", SentenceCard.NUMBER_COLORS["p"]),
+        )
+        # Verbs are highlighted by number but not by case
+        assert SentenceCard._highlight_entries("V", "g", "s")[1] is None
+
+    def test_case_highlighting_uses_prep_case_and_skips_other_pos(
+        self, db_session, qapp
+    ):
+        """Test case colors come from prep_case for prepositions only."""
+        project = create_test_project(db_session, name="Test", text="on hūse fēoll")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        preposition, noun, verb = sentence.tokens
+        preposition.annotation.pos = "E"
+        preposition.annotation.case = "n"
+        preposition.annotation.prep_case = "d"
+        noun.annotation.pos = "N"
+        noun.annotation.case = "d"
+        verb.annotation.pos = "V"
+        verb.annotation.case = "g"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+
+        assert card._cached_colors[0][1] == ("d", card.CASE_COLORS["d"])
+        assert card._cached_colors[1][1] == ("d", card.CASE_COLORS["d"])
+        assert card._cached_colors[2][1] is None
+
+    def test_color_cache_refreshed_on_annotation_applied(self, db_session, qapp):
+        """Test applying an annotation refreshes the token's cached colors."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        assert card._cached_colors[1] == (None, None, None)
+        assert card._highlightable_tokens(0) == []
+
+        annotation = token.annotation
+        annotation.pos = "N"
+        annotation.case = "g"
+        annotation.number = "p"
+        card._on_annotation_applied(annotation)
+
+        assert card._cached_colors[1] == (
+            ("N", card.POS_COLORS["N"]),
+            ("g", card.CASE_COLORS["g"]),
+            ("p", card.NUMBER_COLORS["p"]),
+        )
+        assert card._highlightable_tokens(0) == [(1, "N", card.POS_COLORS["N"])]
+
+    def test_shortcuts_set_up_on_first_show(self, db_session, qapp):
+        """Test keyboard shortcuts are only created once the card is shown."""
+        from PySide6.QtGui import QShortcut
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        card = SentenceCard(project.sentences[0], session=db_session, parent=None)
+        assert card.findChildren(QShortcut) == []
+
+        card.show()
+        card.hide()
+        card.show()
+
+        assert len(card.findChildren(QShortcut)) == 3
+        card.close()
+
+    def test_highlighting_deferred_until_shown(self, db_session, qapp):
+        """Test highlighting a hidden card is deferred to its next show."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        sentence.tokens[1].annotation.pos = "N"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card._current_highlight_mode = "pos"
+        card.set_tokens(sentence.tokens)
+
+        assert card._highlight_dirty
+        assert card.oe_text_edit.extraSelections() == []
+
+        card.show()
+
+        assert not card._highlight_dirty
+        assert len(card.oe_text_edit.extraSelections()) == 1
+        card.close()
+
+    def test_annotation_modal_records_state_before_edit(
+        self, db_session, qapp, monkeypatch
+    ):
+        """Test undo state is captured before the modal edits the annotation."""
+        from oeapp.services import CommandManager
+        from oeapp.ui.dialogs import AnnotationModal
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        command_manager = CommandManager(db_session)
+        card = SentenceCard(
+            sentence, session=db_session, command_manager=command_manager
+        )
+
+        # Closing the modal without changes records nothing
+        def apply_unchanged(modal):
+            modal.annotation_applied.emit(modal.annotation)
+            return 1
+
+        monkeypatch.setattr(AnnotationModal, "exec", apply_unchanged)
+        card._show_annotation_modal(token)
+        assert len(command_manager.undo_stack) == 0
+
+        def apply_noun(modal):
+            modal.annotation.pos = "N"
+            modal.annotation_applied.emit(modal.annotation)
+            return 1
+
+        monkeypatch.setattr(AnnotationModal, "exec", apply_noun)
+        card._show_annotation_modal(token)
+
+        assert len(command_manager.undo_stack) == 1
+        command = command_manager.undo_stack[-1]
+        assert command.before["pos"] is None
+        assert command.after["pos"] == "N"
+
+    def test_highlight_toggle_switches_mode(self, db_session, qapp):
+        """Test toggling a highlight mode on and off drives the dropdown."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        card = SentenceCard(project.sentences[0], session=db_session, parent=None)
+
+        card._on_highlight_toggle("number", True)
+        assert card.highlighting_combo.currentIndex() == 3
+        assert card._current_highlight_mode == "number"
+
+        card._on_highlight_toggle("number", False)
+        assert card.highlighting_combo.currentIndex() == 0
+        assert card._current_highlight_mode is None
+
+    def test_repaint_guard_suspends_updates(self, db_session, qapp):
+        """Test _repaint_guard suspends updates until the outermost block exits."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        card = SentenceCard(project.sentences[0], session=db_session, parent=None)
+
+        with card._repaint_guard():
+            assert not card.updatesEnabled()
+            with card._repaint_guard():
+                assert not card.updatesEnabled()
+            assert not card.updatesEnabled()
+        assert card.updatesEnabled()
+
+    def test_save_annotation_merges_into_stored_annotation(self, db_session, qapp):
+        """Test a detached annotation is saved onto the token's stored one."""
+        from oeapp.models.annotation import Annotation
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        stored = token.annotation
+        card = SentenceCard(sentence, session=db_session, parent=None)
+
+        card._on_annotation_applied(Annotation(token_id=token.id, pos="N", case="n"))
+
+        assert stored.pos == "N"
+        assert stored.case == "n"
+        assert card.annotations[token.id] is stored
+        assert Annotation.get(db_session, token.id) is stored
+
+    def test_save_annotations_commits_once(self, db_session, qapp):
+        """Test annotations saved in quick succession share one commit."""
+        from oeapp.models.annotation import Annotation
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        first, second = sentence.tokens
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            saved = card._save_annotations([Annotation(token_id=first.id, pos="D")])
+            saved += card._save_annotations([Annotation(token_id=second.id, pos="N")])
+            commit.assert_not_called()
+            assert card._annotation_commit_timer.isActive()
+
+            card.flush_pending_edits()
+
+        commit.assert_called_once()
+        assert not card._annotation_commit_timer.isActive()
+        assert saved == [first.annotation, second.annotation]
+        assert [annotation.pos for annotation in saved] == ["D", "N"]
+
+    def test_translation_change_is_debounced(self, db_session, qapp):
+        """Test translation edits are saved once the debounce timer fires."""
+        from oeapp.services import CommandManager
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        command_manager = CommandManager(db_session)
+        card = SentenceCard(
+            sentence, session=db_session, command_manager=command_manager
+        )
+
+        committed = []
+        card.translation_committed.connect(lambda: committed.append(True))
+
+        card.translation_edit.setPlainText("The")
+        card.translation_edit.setPlainText("The king")
+
+        # Nothing is saved while the text is still changing
+        assert card._translation_debounce.isActive()
+        assert sentence.text_modern is None
+
+        card.flush_pending_edits()
+
+        assert not card._translation_debounce.isActive()
+        assert sentence.text_modern == "The king"
+        assert len(command_manager.undo_stack) == 1
+        assert committed == [True]
+
+    def test_annotation_modal_is_reused(self, db_session, qapp, monkeypatch):
+        """Test the annotation modal is built once and re-targeted per token."""
+        from oeapp.ui.dialogs import AnnotationModal
+
+        monkeypatch.setattr(AnnotationModal, "exec", lambda self: 0)
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        sentence.tokens[0].annotation.pos = "D"
+        db_session.commit()
+
+        card = SentenceCard(sentence, session=db_session, parent=None)
+        card._show_annotation_modal(sentence.tokens[0])
+        modal = card._annotation_modal
+        assert modal is not None
+        assert modal.pos_combo.currentIndex() != 0
+
+        card._show_annotation_modal(sentence.tokens[1])
+        assert card._annotation_modal is modal
+        assert modal.token is sentence.tokens[1]
+        assert modal.windowTitle() == "Annotate: cyning"
+        assert modal.pos_combo.currentIndex() == 0
+
 
 class TestClickableTextEdit:
     """Test cases for ClickableTextEdit."""
@@ -164,3 +785,45 @@ class TestClickableTextEdit:
 
         assert double_clicked_pos == point
 
+    def test_clickable_text_edit_click_emits_on_release(self, qapp):
+        """Test a left click emits clicked with the press modifiers."""
+        from PySide6.QtCore import QPoint, Qt
+        from PySide6.QtTest import QTest
+
+        widget = ClickableTextEdit(parent=None)
+        received = []
+        widget.clicked.connect(lambda pos, modifiers: received.append((pos, modifiers)))
+
+        QTest.mouseClick(
+            widget.viewport(),
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.ShiftModifier,
+            QPoint(10, 10),
+        )
+
+        assert received == [(QPoint(10, 10), Qt.KeyboardModifier.ShiftModifier)]
+
+    def test_clickable_text_edit_ignores_drags_and_other_buttons(self, qapp):
+        """Test text-selection drags and right clicks do not emit clicked."""
+        from PySide6.QtCore import QPoint, Qt
+        from PySide6.QtTest import QTest
+
+        widget = ClickableTextEdit(parent=None)
+        received = []
+        widget.clicked.connect(lambda pos, modifiers: received.append(pos))
+
+        viewport = widget.viewport()
+        QTest.mousePress(
+            viewport, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier,
+            QPoint(10, 10),
+        )
+        QTest.mouseRelease(
+            viewport, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier,
+            QPoint(80, 10),
+        )
+        QTest.mouseClick(
+            viewport, Qt.MouseButton.RightButton, Qt.KeyboardModifier.NoModifier,
+            QPoint(10, 10),
+        )
+
+        assert received == []
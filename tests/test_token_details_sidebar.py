@@ -60,6 +60,7 @@ class TestTokenDetailsSidebar:
         sentence2 = sentences[1]
         token2 = sentence2.tokens[0]
         sidebar.update_token(token2, sentence2)
+        sidebar.flush_pending_update()
 
         assert sidebar._current_token == token2
         assert sidebar._current_sentence == sentence2
@@ -111,3 +112,333 @@ class TestTokenDetailsSidebar:
         assert sidebar._current_token == token
         # Should handle None annotation gracefully
         # The method should not crash even if annotation is None
+
+    def test_token_details_sidebar_reuses_labels(self, db_session, qapp):
+        """Test updating the sidebar reuses its labels instead of rebuilding."""
+        from PySide6.QtWidgets import QLabel
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        article, noun = sentence.tokens
+        article.annotation.pos = "D"
+        article.annotation.article_type = "d"
+        noun.annotation.pos = "V"
+        noun.annotation.verb_class = "s1"
+        noun.annotation.root = "cyning"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        labels = set(sidebar.findChildren(QLabel))
+
+        sidebar.update_token(article, sentence)
+        shown = [label.text() for label in sidebar._field_labels if not label.isHidden()]
+        assert shown[0] == "Article Type: Definite (d)"
+        assert len(shown) == 4
+        assert sidebar._dict_button.isHidden()
+
+        sidebar.update_token(noun, sentence)
+        sidebar.flush_pending_update()
+        shown = [label.text() for label in sidebar._field_labels if not label.isHidden()]
+        assert shown[0].startswith("Verb Class: ")
+        assert len(shown) == 7
+        assert not sidebar._dict_button.isHidden()
+        assert sidebar._root_label.text() == "Root: cyning"
+
+        sidebar.clear()
+        assert sidebar._details_widget.isHidden()
+        assert not sidebar._empty_widget.isHidden()
+        assert set(sidebar.findChildren(QLabel)) == labels
+
+    def test_token_details_sidebar_skips_unchanged_token(self, db_session, qapp):
+        """Test re-selecting the displayed token does not refresh the sidebar."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        token.annotation.pos = "N"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(token, sentence)
+
+        with patch.object(sidebar, "_emit_rows") as display:
+            sidebar.update_token(token, sentence)
+            sidebar.flush_pending_update()
+            display.assert_not_called()
+
+            # A changed annotation is displayed again
+            token.annotation.case = "g"
+            sidebar.update_token(token, sentence)
+            sidebar.flush_pending_update()
+            display.assert_called_once()
+
+    def test_token_details_sidebar_batches_updates(self, db_session, qapp):
+        """Test updates are batched and unchanged style sheets are not reset."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        first, second = sentence.tokens
+        first.annotation.pos = "N"
+        second.annotation.pos = "N"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(first, sentence)
+        assert sidebar.content_widget.updatesEnabled()
+        assert sidebar._root_label.styleSheet() == sidebar.UNSET_FIELD_STYLE
+
+        with (
+            patch.object(
+                sidebar._root_label,
+                "setStyleSheet",
+                wraps=sidebar._root_label.setStyleSheet,
+            ) as set_style,
+            patch.object(sidebar._root_label, "styleSheet") as get_style,
+        ):
+            sidebar.update_token(second, sentence)
+            sidebar.flush_pending_update()
+            set_style.assert_not_called()
+            get_style.assert_not_called()
+        assert sidebar.content_widget.updatesEnabled()
+
+    def test_token_details_sidebar_shares_fonts(self, db_session, qapp):
+        """Test field fonts are shared and only reset when boldness changes."""
+        from unittest.mock import patch
+
+        from oeapp.ui.token_details_sidebar import _font
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        first, second = sentence.tokens
+        first.annotation.pos = "N"
+        second.annotation.pos = "N"
+        db_session.commit()
+
+        assert _font("Helvetica", 12) is _font("Helvetica", 12)
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(first, sentence)
+        label = sidebar._field_labels[2]
+        assert label.font().bold()
+
+        with patch.object(label, "setFont", wraps=label.setFont) as set_font:
+            sidebar.update_token(second, sentence)
+            sidebar.flush_pending_update()
+            set_font.assert_not_called()
+
+    def test_token_details_sidebar_pos_field_rows(self, qapp):
+        """Test every POS code has field rows that fit in the label pool."""
+        from oeapp.models.annotation import Annotation
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        assert set(sidebar.POS_FIELD_ROWS) == set(sidebar.PART_OF_SPEECH_MAP) - {
+            "",
+            "B",
+            "C",
+            "I",
+        }
+        # The label pool is created up front, big enough for any POS
+        assert len(sidebar._field_labels) == max(
+            len(rows) for rows in sidebar.POS_FIELD_ROWS.values()
+        )
+        for rows in sidebar.POS_FIELD_ROWS.values():
+            for _, map_name, attr_name, _ in rows:
+                assert isinstance(getattr(sidebar, map_name), dict)
+                assert attr_name in (*Annotation.STATE_FIELDS, "article_type")
+
+    def test_token_details_sidebar_unset_fields_show_unknown(self, db_session, qapp):
+        """Test unset POS-specific fields are shown as unknown."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        token.annotation.pos = "N"
+        token.annotation.gender = "m"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(token, sentence)
+        shown = [label.text() for label in sidebar._field_labels if not label.isHidden()]
+        assert shown == [
+            f"Gender: {sidebar.GENDER_MAP['m']}",
+            "Number: ?",
+            "Case: ?",
+            "Declension: ?",
+        ]
+
+    def test_token_details_sidebar_header_set_only_when_changed(
+        self, db_session, qapp
+    ):
+        """Test the token header is only re-rendered when its text changes."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        token.annotation.pos = "N"
+        token.annotation.case = "n"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(token, sentence)
+        header = sidebar._token_label.text()
+        assert header.startswith(sidebar.SUPERSCRIPT_TEMPLATE.format("n"))
+        assert header.endswith(sidebar.SUBSCRIPT_TEMPLATE.format("nom"))
+
+        with patch.object(
+            sidebar._token_label, "setText", wraps=sidebar._token_label.setText
+        ) as set_text:
+            # The confidence is not part of the header
+            token.annotation.confidence = 50
+            sidebar.update_token(token, sentence)
+            sidebar.flush_pending_update()
+            set_text.assert_not_called()
+
+            token.annotation.case = "g"
+            sidebar.update_token(token, sentence)
+            sidebar.flush_pending_update()
+            set_text.assert_called_once()
+
+    def test_token_details_sidebar_clear_when_empty_is_noop(self, db_session, qapp):
+        """Test clearing an already empty sidebar does not touch the layout."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        sentence = project.sentences[0]
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        with patch.object(sidebar, "_batch_updates", wraps=sidebar._batch_updates) as batch:
+            sidebar.clear()
+            batch.assert_not_called()
+
+            sidebar.update_token(sentence.tokens[0], sentence)
+            sidebar.clear()
+            assert batch.call_count == 2
+        assert sidebar._details_widget.isHidden()
+        assert not sidebar._empty_widget.isHidden()
+
+    def test_token_details_sidebar_coalesces_rapid_updates(self, db_session, qapp):
+        """Test a burst of updates only displays the first and the latest token."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning is god")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        tokens = sentence.tokens
+        sidebar = TokenDetailsSidebar(parent=None)
+
+        with patch.object(
+            sidebar, "_display_token", wraps=sidebar._display_token
+        ) as display:
+            for token in tokens:
+                sidebar.update_token(token, sentence)
+            assert sidebar._current_token is tokens[0]
+            assert display.call_count == 1
+
+            sidebar.flush_pending_update()
+            assert sidebar._current_token is tokens[-1]
+            assert display.call_count == 2
+
+            # Clearing drops any update that is still pending
+            sidebar.update_token(tokens[1], sentence)
+            sidebar.update_token(tokens[2], sentence)
+            assert display.call_count == 3
+            sidebar.clear()
+            sidebar.flush_pending_update()
+            assert display.call_count == 3
+        assert sidebar._details_widget.isHidden()
+
+    def test_token_details_sidebar_field_text_is_shared(self, qapp):
+        """Test formatted field texts are shared between tokens."""
+        text = TokenDetailsSidebar._field_text("Case", "CASE_MAP", "g")
+        assert text == f"Case: {TokenDetailsSidebar.CASE_MAP['g']}"
+        assert TokenDetailsSidebar._field_text("Case", "CASE_MAP", "g") is text
+        assert TokenDetailsSidebar._field_text("Case", "CASE_MAP", None) == "Case: ?"
+
+    def test_token_details_sidebar_defers_updates_while_hidden(self, db_session, qapp):
+        """Test updates made while hidden are displayed when shown again."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        first, second = sentence.tokens
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.show()
+        sidebar.update_token(first, sentence)
+        sidebar.hide()
+
+        sidebar.flush_pending_update()
+        sidebar.update_token(second, sentence)
+        assert sidebar._current_token is first
+
+        sidebar.show()
+        assert sidebar._current_token is second
+        sidebar.close()
+
+    def test_token_details_sidebar_only_sets_changed_text(self, db_session, qapp):
+        """Test only labels whose text changed are given new text."""
+        from unittest.mock import patch
+
+        from PySide6.QtWidgets import QLabel
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        token = sentence.tokens[1]
+        token.annotation.pos = "N"
+        token.annotation.case = "n"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(token, sentence)
+
+        with patch.object(QLabel, "setText") as set_text:
+            token.annotation.confidence = 75
+            sidebar.update_token(token, sentence)
+            sidebar.flush_pending_update()
+        set_text.assert_called_once_with("Confidence: 75%")
+        assert sidebar._label_texts[sidebar._confidence_label] == "Confidence: 75%"
+
+    def test_token_details_sidebar_header_escapes_surface(self, qapp):
+        """Test the token header shows markup characters in the surface."""
+        header = TokenDetailsSidebar._header_html("n", "", "a<b>&c", "")
+        assert header.endswith("a&lt;b&gt;&amp;c")
+        assert TokenDetailsSidebar._header_html("n", "", "a<b>&c", "") is header
+
+    def test_token_details_sidebar_pos_without_fields(self, db_session, qapp):
+        """Test a POS without specific fields hides every field label."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        noun, adverb = sentence.tokens
+        noun.annotation.pos = "N"
+        adverb.annotation.pos = "B"
+        db_session.commit()
+
+        sidebar = TokenDetailsSidebar(parent=None)
+        sidebar.update_token(noun, sentence)
+        with patch.object(sidebar, "_emit_rows") as emit_rows:
+            sidebar.update_token(adverb, sentence)
+            sidebar.flush_pending_update()
+            emit_rows.assert_not_called()
+        assert all(label.isHidden() for label in sidebar._field_labels)
+        assert not sidebar._annotation_widget.isHidden()
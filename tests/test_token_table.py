@@ -71,6 +71,26 @@ class TestTokenTable:
         assert token.id in table.annotations
         assert table.annotations[token.id] == annotation
 
+    def test_token_table_refresh_annotations_reuses_items(self, db_session, qapp):
+        """Test refresh_annotations updates cell text in place."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+
+        sentence = project.sentences[0]
+        tokens = list(sentence.tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        pos_item = table.table.item(1, 1)
+        assert pos_item.text() == "—"
+
+        tokens[1].annotation.pos = "N"
+        table.refresh_annotations(tokens)
+
+        assert table.table.item(1, 1) is pos_item
+        assert pos_item.text() == "N"
+        assert table.table.item(1, 0).text() == "cyning"
+
     def test_token_table_get_selected_token(self, db_session, qapp):
         """Test TokenTable gets selected token."""
         project = create_test_project(db_session, name="Test", text="Se cyning")
@@ -140,6 +160,284 @@ class TestTokenTable:
             table.select_token(1)
             assert table.table.currentRow() == 1
 
+    def test_token_table_set_tokens_batches_updates(self, db_session, qapp):
+        """Test set_tokens suspends repaints and signals while populating."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        selected = []
+        table.token_selected.connect(selected.append)
+
+        set_row_count = table.table.setRowCount
+
+        def check_batched(rows):
+            assert not table.table.updatesEnabled()
+            assert table.table.signalsBlocked()
+            set_row_count(rows)
+
+        with patch.object(table.table, "setRowCount", side_effect=check_batched):
+            table.set_tokens(tokens)
+        assert table.table.updatesEnabled()
+        assert not table.table.signalsBlocked()
+
+        table.select_token(1)
+        table.set_tokens(tokens[:1])
+        assert selected == [tokens[1]]
+
+    def test_token_table_unset_cells_are_cloned_dashes(self, db_session, qapp):
+        """Test unset annotation cells are dashes cloned from one prototype."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+        tokens[1].annotation.pos = "N"
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+
+        assert table.table.item(1, 1).text() == "N"
+        assert table.table.item(1, 2).text() == "—"
+        assert table.table.item(1, 2) is not table._dash_item
+        assert table.table.item(0, 2) is not table.table.item(1, 2)
+
+    def test_token_table_update_annotation_finds_row_by_token_id(
+        self, db_session, qapp
+    ):
+        """Test update_annotation updates the row of the annotation's token."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        assert table._row_by_token_id == {tokens[0].id: 0, tokens[1].id: 1}
+
+        annotation = tokens[1].annotation
+        annotation.pos = "N"
+        table.update_annotation(annotation)
+        table.flush_pending_annotations()
+        assert table.table.item(1, 1).text() == "N"
+        assert table.table.item(0, 1).text() == "—"
+
+        # Annotations of tokens that are not displayed are ignored
+        table.set_tokens(tokens[:1])
+        table.update_annotation(annotation)
+        table.flush_pending_annotations()
+        assert table.table.rowCount() == 1
+
+    def test_token_table_set_tokens_reuses_items(self, db_session, qapp):
+        """Test repopulating the table updates the existing items in place."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        word_item = table.table.item(0, 0)
+        pos_item = table.table.item(1, 1)
+
+        tokens[1].annotation.pos = "N"
+        table.refresh()
+
+        assert table.table.item(0, 0) is word_item
+        assert table.table.item(1, 1) is pos_item
+        assert pos_item.text() == "N"
+
+        # Rows for new tokens get new items
+        table.set_tokens([*tokens, tokens[0]])
+        assert table.table.item(0, 0) is word_item
+        assert table.table.item(2, 0).text() == "Se"
+
+    def test_token_table_update_annotation_reuses_items(self, db_session, qapp):
+        """Test annotation updates change the existing items in place."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        pos_item = table.table.item(1, 1)
+        root_item = table.table.item(1, 3)
+
+        annotation = tokens[1].annotation
+        annotation.pos = "N"
+        table.update_annotation(annotation)
+        table.flush_pending_annotations()
+
+        assert table.table.item(1, 1) is pos_item
+        assert table.table.item(1, 3) is root_item
+        assert pos_item.text() == "N"
+
+    def test_token_table_show_does_not_repopulate(self, db_session, qapp):
+        """Test showing an up-to-date table leaves its rows alone."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        with patch.object(table, "_populate") as populate:
+            table.show()
+            table.hide()
+            table.show()
+        populate.assert_not_called()
+
+    def test_token_table_stretches_columns_after_populating(
+        self, db_session, qapp
+    ):
+        """Test columns are only stretched once the rows are filled."""
+        from unittest.mock import patch
+
+        from PySide6.QtWidgets import QHeaderView
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        header = table.table.horizontalHeader()
+        set_row_count = table.table.setRowCount
+
+        def check_interactive(rows):
+            assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Interactive
+            set_row_count(rows)
+
+        with patch.object(table.table, "setRowCount", side_effect=check_interactive):
+            table.set_tokens(tokens)
+        assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Stretch
+
+    def test_token_table_set_tokens_releases_removed_items(self, db_session, qapp):
+        """Test items of rows removed by set_tokens are taken out first."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        removed = table.table.item(1, 0)
+
+        table.set_tokens(tokens[:1])
+        assert table.table.rowCount() == 1
+        # The item now belongs to Python rather than having been deleted
+        assert removed.text() == "cyning"
+        assert removed.tableWidget() is None
+
+    def test_token_table_populated_when_shown(self, db_session, qapp):
+        """Test a hidden table is only populated once it is shown."""
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.setVisible(False)
+        table.set_tokens(tokens)
+        assert table.table.rowCount() == 0
+
+        # Annotation changes while hidden are picked up when populated
+        tokens[1].annotation.pos = "N"
+        table.update_annotation(tokens[1].annotation)
+        assert table.table.rowCount() == 0
+
+        table.setVisible(True)
+        assert table.table.rowCount() == len(tokens)
+        assert table.table.item(1, 1).text() == "N"
+        table.setVisible(False)
+
+        # Selecting a token populates the table first
+        table.set_tokens(tokens[:1])
+        table.select_token(0)
+        assert table.table.rowCount() == 1
+        assert table.get_selected_token() is tokens[0]
+
+    def test_token_table_coalesces_annotation_updates(self, db_session, qapp):
+        """Test back-to-back annotation updates are written in one batch."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        tokens[0].annotation.pos = "D"
+        tokens[1].annotation.pos = "N"
+
+        with patch.object(
+            table, "_batch_updates", wraps=table._batch_updates
+        ) as batch:
+            table.update_annotation(tokens[0].annotation)
+            table.update_annotation(tokens[1].annotation)
+            table.update_annotation(tokens[1].annotation)
+            assert table.table.item(1, 1).text() == "—"
+            assert table._annotation_timer.isActive()
+
+            table.flush_pending_annotations()
+            batch.assert_called_once()
+        assert table.table.item(0, 1).text() == "D"
+        assert table.table.item(1, 1).text() == "N"
+        assert not table._annotation_timer.isActive()
+
+    def test_token_table_rows_have_fixed_height(self, qapp):
+        """Test rows have a fixed height instead of being sized to contents."""
+        from PySide6.QtWidgets import QHeaderView
+
+        table = TokenTable(parent=None)
+        header = table.table.verticalHeader()
+
+        assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+        assert header.defaultSectionSize() == (
+            table.table.fontMetrics().height() + table.ROW_PADDING
+        )
+
+    def test_token_table_annotation_texts(self, db_session, qapp):
+        """Test annotation column texts are computed once per annotation."""
+        from oeapp.ui.token_table import _DASH
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        annotation = project.sentences[0].tokens[1].annotation
+        annotation.pos = "N"
+        annotation.root = "cyning"
+
+        texts = TokenTable._annotation_texts(annotation)
+        assert len(texts) == len(TokenTable.ANNOTATION_COLUMNS)
+        assert texts[0] == "N"
+        assert texts[TokenTable.ANNOTATION_COLUMNS.index("root")] == "cyning"
+        assert texts[1] is _DASH
+
+        assert TokenTable._annotation_texts(None) == (_DASH,) * len(texts)
+
+    def test_token_table_caches_selected_token(self, db_session, qapp):
+        """Test the selected token is remembered when the selection changes."""
+        from unittest.mock import patch
+
+        project = create_test_project(db_session, name="Test", text="Se cyning")
+        db_session.commit()
+        tokens = list(project.sentences[0].tokens)
+
+        table = TokenTable(parent=None)
+        table.set_tokens(tokens)
+        table.select_token(1)
+        with patch.object(table.table, "currentRow") as current_row:
+            assert table.get_selected_token() is tokens[1]
+        current_row.assert_not_called()
+
+        # Repopulating keeps the token in the current row
+        table.set_tokens(list(reversed(tokens)))
+        assert table.get_selected_token() is tokens[0]
+
+        # No current row means no selected token, and none is emitted
+        selected = []
+        table.token_selected.connect(selected.append)
+        table.table.setCurrentCell(-1, -1)
+        assert table.get_selected_token() is None
+        assert selected == []
+
 
 class TestAnnotationTableWidget:
     """Test cases for AnnotationTableWidget."""
@@ -1,6 +1,6 @@
 """Unit tests for utility functions."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -27,6 +27,11 @@ class TestToUtcIso:
         assert result is not None
         assert "2024-01-15T10:30:45" in result
 
+    def test_converts_other_timezone_to_utc(self):
+        """Test converting a datetime in another timezone to UTC."""
+        dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone(timedelta(hours=2)))
+        assert to_utc_iso(dt) == "2024-01-15T10:30:45+00:00"
+
     def test_returns_none_for_none(self):
         """Test returns None when input is None."""
         result = to_utc_iso(None)
@@ -67,6 +72,18 @@ class TestFromUtcIso:
         assert isinstance(result, datetime)
         assert result.year == 2024
 
+    def test_parses_utc_strings_as_naive(self):
+        """Test UTC ISO strings parse to the same naive datetime."""
+        expected = datetime(2024, 1, 15, 10, 30, 45, 123456)
+        assert from_utc_iso("2024-01-15T10:30:45.123456+00:00") == expected
+        assert from_utc_iso("2024-01-15T10:30:45.123456Z") == expected
+        assert from_utc_iso("2024-01-15T10:30:45.123456Z").tzinfo is None
+
+    def test_converts_other_timezone_to_utc(self):
+        """Test parsing an ISO string in another timezone converts it to UTC."""
+        result = from_utc_iso("2024-01-15T12:30:45+02:00")
+        assert result == datetime(2024, 1, 15, 10, 30, 45)
+
     def test_returns_none_for_none(self):
         """Test returns None when input is None."""
         result = from_utc_iso(None)
@@ -100,6 +117,12 @@ class TestGetResourcePath:
         assert "subdir" in str(path)
         assert path.name == "file.txt"
 
+    def test_caches_paths(self):
+        """Test repeated lookups return the cached path."""
+        path = get_resource_path("assets/logo.png")
+        assert get_resource_path("assets/logo.png") is path
+        assert path == Path(__file__).parent.parent / "assets" / "logo.png"
+
 
 class TestGetLogoPixmap:
     """Test cases for get_logo_pixmap()."""